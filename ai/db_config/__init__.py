@@ -9,6 +9,7 @@ from .database import (
     init_db,
     drop_db,
     engine,
+    make_engine,
     SessionLocal
 )
 
@@ -16,13 +17,17 @@ from .crud import (
     # Session operations
     create_session,
     get_session,
+    get_session_row,
     get_sessions_by_user,
+    get_sessions_by_user_rows,
+    iter_sessions_by_user,
     update_session,
     delete_session,
     count_user_sessions,
     
     # Message operations
     add_message_to_session,
+    add_messages_to_session,
     get_session_messages,
     get_last_n_messages,
     clear_session_messages,
@@ -39,24 +44,32 @@ from .crud import (
     
     # Goal operations
     create_goal,
+    bulk_create_goals,
     get_goal,
     get_goals_by_roadmap,
+    get_goals_by_roadmap_rows,
     update_goal,
     mark_goal_started,
     mark_goal_completed,
     update_goal_progress,
     delete_goal,
     count_goals_by_roadmap,
+    roadmap_all_goals_completed,
     
     # Learning material operations
     create_learning_material,
+    bulk_create_learning_materials,
     get_learning_material,
     get_materials_by_goal,
+    get_materials_by_goal_rows,
     get_materials_by_roadmap,
+    get_materials_by_roadmap_rows,
     update_learning_material,
     mark_material_completed,
     delete_learning_material,
     count_materials_by_goal,
+    get_goal_material_counts,
+    exists_materials_for_roadmap,
     
     # User skill operations
     create_user_skill,
@@ -67,10 +80,14 @@ from .crud import (
     upsert_user_skill,
     delete_user_skill,
     bulk_create_user_skills,
+    bulk_upsert_user_skills,
     
     # Complex queries
     get_session_with_full_roadmap,
+    get_sessions_with_full_tree,
     get_user_progress_stats,
+    invalidate_progress_stats,
+    get_session_progress_stats,
     get_next_incomplete_goal,
     search_learning_materials,
     
@@ -93,18 +110,23 @@ __all__ = [
     'init_db',
     'drop_db',
     'engine',
+    'make_engine',
     'SessionLocal',
     
     # Session operations
     'create_session',
     'get_session',
+    'get_session_row',
     'get_sessions_by_user',
+    'get_sessions_by_user_rows',
+    'iter_sessions_by_user',
     'update_session',
     'delete_session',
     'count_user_sessions',
     
     # Message operations
     'add_message_to_session',
+    'add_messages_to_session',
     'get_session_messages',
     'get_last_n_messages',
     'clear_session_messages',
@@ -121,24 +143,32 @@ __all__ = [
     
     # Goal operations
     'create_goal',
+    'bulk_create_goals',
     'get_goal',
     'get_goals_by_roadmap',
+    'get_goals_by_roadmap_rows',
     'update_goal',
     'mark_goal_started',
     'mark_goal_completed',
     'update_goal_progress',
     'delete_goal',
     'count_goals_by_roadmap',
+    'roadmap_all_goals_completed',
     
     # Learning material operations
     'create_learning_material',
+    'bulk_create_learning_materials',
     'get_learning_material',
     'get_materials_by_goal',
+    'get_materials_by_goal_rows',
     'get_materials_by_roadmap',
+    'get_materials_by_roadmap_rows',
     'update_learning_material',
     'mark_material_completed',
     'delete_learning_material',
     'count_materials_by_goal',
+    'get_goal_material_counts',
+    'exists_materials_for_roadmap',
     
     # User skill operations
     'create_user_skill',
@@ -149,10 +179,14 @@ __all__ = [
     'upsert_user_skill',
     'delete_user_skill',
     'bulk_create_user_skills',
+    'bulk_upsert_user_skills',
     
     # Complex queries
     'get_session_with_full_roadmap',
+    'get_sessions_with_full_tree',
     'get_user_progress_stats',
+    'invalidate_progress_stats',
+    'get_session_progress_stats',
     'get_next_incomplete_goal',
     'search_learning_materials',
 
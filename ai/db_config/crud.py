@@ -8,13 +8,20 @@ Contains create, read, update, and delete functions for:
 - UserSkill
 """
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
-from typing import List, Optional, Dict, Any
+from sqlalchemy.orm import Session, joinedload, selectinload, contains_eager
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy import and_, or_, desc, func, case, cast, distinct, update, insert, select, literal, true, lambda_stmt, Integer, DateTime, JSON, Row, event
+from typing import List, Optional, Dict, Any, Iterator, Tuple, Callable
 from datetime import datetime
+from functools import wraps
+import threading
+import time
+
+from config import get_settings
 
 from models.db_models import (
     Session as SessionModel,
+    SessionMessage,
     Roadmap,
     RoadmapGoal,
     LearningMaterial,
@@ -23,16 +30,225 @@ from models.db_models import (
     QuizQuestion,
     QuizAttempt,
     QuizAnswer,
+    GraduationProjectQuestion,
+    GraduationProjectSubmission,
     SessionStatusEnum,
     RoadmapStatusEnum,
-    SkillLevelEnum
+    SkillLevelEnum,
+    QuestionDifficultyEnum
+)
+
+
+# Server-side "now" in UTC, matching the naive datetime.utcnow() values the
+# models use. Used in UPDATE statements so the database stamps the time itself.
+_DB_UTC_NOW = func.timezone('utc', func.now())
+
+# Whole minutes between an attempt's start and now, computed by the database
+_ATTEMPT_ELAPSED_MINUTES = cast(
+    func.floor(func.extract('epoch', _DB_UTC_NOW - QuizAttempt.started_at) / 60),
+    Integer
+)
+
+
+# Loader options for session -> roadmap -> goals -> materials. The roadmap is
+# one-to-one and rides along in the JOIN; the one-to-many legs use selectinload
+# (one IN query per level) so goals x materials aren't multiplied into one result set.
+_FULL_TREE_LOADERS = (
+    joinedload(SessionModel.roadmap)
+    .selectinload(Roadmap.goals)
+    .selectinload(RoadmapGoal.learning_materials),
+)
+
+
+# Columns returned by the read-only *_rows list helpers. Large text columns
+# (e.g. material content) are left out; use the ORM getters when they are needed.
+_SESSION_LIST_COLUMNS = (
+    SessionModel.id,
+    SessionModel.user_id,
+    SessionModel.session_name,
+    SessionModel.description,
+    SessionModel.status,
+    SessionModel.created_at,
+    SessionModel.updated_at,
+    SessionModel.completed_at,
+)
+
+_GOAL_LIST_COLUMNS = (
+    RoadmapGoal.id,
+    RoadmapGoal.roadmap_id,
+    RoadmapGoal.goal_number,
+    RoadmapGoal.title,
+    RoadmapGoal.description,
+    RoadmapGoal.priority,
+    RoadmapGoal.skill_level,
+    RoadmapGoal.estimated_hours,
+    RoadmapGoal.actual_hours_spent,
+    RoadmapGoal.is_completed,
+    RoadmapGoal.completion_percentage,
+    RoadmapGoal.started_at,
+    RoadmapGoal.completed_at,
 )
 
+_MATERIAL_LIST_COLUMNS = (
+    LearningMaterial.id,
+    LearningMaterial.goal_id,
+    LearningMaterial.material_type,
+    LearningMaterial.title,
+    LearningMaterial.description,
+    LearningMaterial.source_url,
+    LearningMaterial.estimated_time_minutes,
+    LearningMaterial.difficulty_level,
+    LearningMaterial.relevance_score,
+    LearningMaterial.quality_score,
+    LearningMaterial.is_completed,
+    LearningMaterial.completed_at,
+)
+
+
+def _patch(db: Session, model, pk: int, values: Dict[str, Any], *criteria, commit: bool = True):
+    """
+    Update one row with a single UPDATE ... RETURNING and commit.
+    
+    Returns the updated instance, or None if no row matched. With no values,
+    the row is returned unchanged. Pass commit=False to leave the UPDATE in the
+    caller's transaction.
+    """
+    if not values:
+        return db.get(model, pk)
+    
+    # populate_existing: an instance already in the session is refreshed from
+    # the RETURNING row, so server-side expressions come back as values
+    obj = db.execute(
+        update(model)
+        .where(model.id == pk, *criteria)
+        .values(**values)
+        .returning(model),
+        execution_options={"populate_existing": True}
+    ).scalar_one_or_none()
+    if commit:
+        db.commit()
+    return obj
+
+
+def _keyset_after(score_column, id_column, after: Tuple[Optional[float], int]):
+    """
+    Keyset-pagination criterion for rows ordered by (score DESC, id DESC).
+    
+    `after` is (score, id) of the last row of the previous page. Scores may be
+    NULL; PostgreSQL sorts those first under DESC, so a NULL cursor continues
+    through the remaining NULL-score rows and then every scored row.
+    """
+    last_score, last_id = after
+    if last_score is None:
+        return or_(
+            and_(score_column.is_(None), id_column < last_id),
+            score_column.isnot(None)
+        )
+    return or_(
+        score_column < last_score,
+        and_(score_column == last_score, id_column < last_id)
+    )
+
+
+def _commit_or_flush(db: Session, commit: bool) -> None:
+    """Commit, or just flush (assigning ids) when the caller owns the transaction."""
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+
+
+def _allowed_values(kwargs: Dict[str, Any], allowed_fields: List[str]) -> Dict[str, Any]:
+    """Keep only allowed, non-None fields from update kwargs."""
+    return {k: v for k, v in kwargs.items() if k in allowed_fields and v is not None}
+
+
+# ============================================================================
+# PROGRESS STATS CACHE
+# ============================================================================
+
+# Process-local cache for the progress-stats aggregates, which dashboards poll
+# with unchanged data between writes. Entries expire after the configured TTL;
+# the mutators that change what the stats count clear the cache when their
+# transaction commits.
+_PROGRESS_STATS_MAXSIZE = 10_000
+_progress_stats_cache: Dict[Tuple[Any, ...], Tuple[float, Dict[str, Any]]] = {}
+_progress_stats_lock = threading.Lock()
+_progress_stats_generation = 0
+
+
+def invalidate_progress_stats() -> None:
+    """Drop all cached progress stats (call after writes made outside these helpers)."""
+    global _progress_stats_generation
+    with _progress_stats_lock:
+        _progress_stats_generation += 1
+        _progress_stats_cache.clear()
+
+
+def _cached_progress_stats(fn: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+    """Serve a stats reader from the cache for PROGRESS_STATS_CACHE_TTL seconds (0 disables)."""
+    @wraps(fn)
+    def wrapper(db: Session, *args, **kwargs) -> Dict[str, Any]:
+        ttl = get_settings().progress_stats_cache_ttl
+        if ttl <= 0:
+            return fn(db, *args, **kwargs)
+        
+        key = (fn.__name__, *args, *sorted(kwargs.items()))
+        now = time.monotonic()
+        with _progress_stats_lock:
+            entry = _progress_stats_cache.get(key)
+            generation = _progress_stats_generation
+        if entry is not None and entry[0] > now:
+            return dict(entry[1])
+        
+        stats = fn(db, *args, **kwargs)
+        with _progress_stats_lock:
+            # Skip the store if a write invalidated the cache while we were reading
+            if generation == _progress_stats_generation:
+                if len(_progress_stats_cache) >= _PROGRESS_STATS_MAXSIZE:
+                    _progress_stats_cache.pop(next(iter(_progress_stats_cache)))
+                _progress_stats_cache[key] = (now + ttl, stats)
+        return dict(stats)
+    return wrapper
+
+
+# Session.info flag: this transaction changed data the progress stats count
+_PROGRESS_STATS_DIRTY = "progress_stats_dirty"
+
+
+def _invalidates_progress_stats(fn):
+    """
+    Clear the progress-stats cache when the wrapped mutator's transaction commits.
+    
+    Clearing on return would let a concurrent reader re-cache the pre-commit state
+    whenever the caller passes commit=False and commits later.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        db = kwargs["db"] if "db" in kwargs else args[0]
+        # Set before the call: mutators that commit themselves fire after_commit inside it
+        db.info[_PROGRESS_STATS_DIRTY] = True
+        return fn(*args, **kwargs)
+    return wrapper
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_progress_stats_on_commit(session: Session) -> None:
+    if session.info.pop(_PROGRESS_STATS_DIRTY, False):
+        invalidate_progress_stats()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_progress_stats_flag(session: Session) -> None:
+    # Nothing was written, so the cached stats are still current
+    session.info.pop(_PROGRESS_STATS_DIRTY, None)
+
 
 # ============================================================================
 # SESSION OPERATIONS
 # ============================================================================
 
+@_invalidates_progress_stats
 def create_session(
     db: Session,
     user_id: str,
@@ -45,18 +261,23 @@ def create_session(
         user_id=user_id,
         session_name=session_name,
         description=description,
-        status=status,
-        messages=[]  # Initialize empty messages list
+        status=status
     )
     db.add(session)
     db.commit()
-    db.refresh(session)
     return session
 
 
 def get_session(db: Session, session_id: int) -> Optional[SessionModel]:
-    """Get a session by ID."""
-    return db.query(SessionModel).filter(SessionModel.id == session_id).first()
+    """Get a session by ID (served from the session's identity map when already loaded)."""
+    return db.get(SessionModel, session_id)
+
+
+def get_session_row(db: Session, session_id: int) -> Optional[Row]:
+    """Read-only variant of get_session returning a plain row (no ORM instance)."""
+    return db.execute(
+        lambda_stmt(lambda: select(*_SESSION_LIST_COLUMNS).where(SessionModel.id == session_id))
+    ).first()
 
 
 def get_sessions_by_user(
@@ -64,17 +285,65 @@ def get_sessions_by_user(
     user_id: str,
     status: Optional[SessionStatusEnum] = None,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    eager: bool = False
 ) -> List[SessionModel]:
-    """Get all sessions for a user with optional status filter."""
+    """
+    Get all sessions for a user with optional status filter.
+    
+    Set eager=True when the caller walks session.roadmap.goals; the roadmaps
+    and goals are then loaded with one extra query each instead of one per session.
+    """
     query = db.query(SessionModel).filter(SessionModel.user_id == user_id)
     
     if status:
         query = query.filter(SessionModel.status == status)
     
+    if eager:
+        query = query.options(selectinload(SessionModel.roadmap).selectinload(Roadmap.goals))
+    
     return query.order_by(desc(SessionModel.created_at)).offset(skip).limit(limit).all()
 
 
+def get_sessions_by_user_rows(
+    db: Session,
+    user_id: str,
+    status: Optional[SessionStatusEnum] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Row]:
+    """Read-only variant of get_sessions_by_user returning plain rows (no ORM instances)."""
+    stmt = select(*_SESSION_LIST_COLUMNS).where(SessionModel.user_id == user_id)
+    
+    if status:
+        stmt = stmt.where(SessionModel.status == status)
+    
+    stmt = stmt.order_by(desc(SessionModel.created_at)).offset(skip).limit(limit)
+    return db.execute(stmt).all()
+
+
+def iter_sessions_by_user(
+    db: Session,
+    user_id: str,
+    status: Optional[SessionStatusEnum] = None,
+    batch_size: int = 200
+) -> Iterator[SessionModel]:
+    """
+    Stream all sessions for a user, newest first.
+    
+    Uses a server-side cursor and fetches `batch_size` rows at a time, so
+    memory stays flat regardless of how many sessions the user has.
+    """
+    stmt = select(SessionModel).where(SessionModel.user_id == user_id)
+    
+    if status:
+        stmt = stmt.where(SessionModel.status == status)
+    
+    stmt = stmt.order_by(desc(SessionModel.created_at)).execution_options(yield_per=batch_size)
+    yield from db.scalars(stmt)
+
+
+@_invalidates_progress_stats
 def update_session(
     db: Session,
     session_id: int,
@@ -83,54 +352,71 @@ def update_session(
     status: Optional[SessionStatusEnum] = None
 ) -> Optional[SessionModel]:
     """Update a session."""
-    session = get_session(db, session_id)
-    if not session:
-        return None
-    
-    if session_name is not None:
-        session.session_name = session_name
-    if description is not None:
-        session.description = description
-    if status is not None:
-        session.status = status
-        if status == SessionStatusEnum.COMPLETED:
-            session.completed_at = datetime.utcnow()
+    values = {
+        k: v for k, v in {
+            'session_name': session_name,
+            'description': description,
+            'status': status
+        }.items() if v is not None
+    }
+    if status == SessionStatusEnum.COMPLETED:
+        values['completed_at'] = _DB_UTC_NOW
     
-    db.commit()
-    db.refresh(session)
-    return session
+    return _patch(db, SessionModel, session_id, values)
 
 
+@_invalidates_progress_stats
 def delete_session(db: Session, session_id: int) -> bool:
     """Delete a session (cascades to roadmap, goals, and materials)."""
-    session = get_session(db, session_id)
-    if not session:
-        return False
-    
-    db.delete(session)
+    deleted = db.query(SessionModel).filter(
+        SessionModel.id == session_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
 
 
 def count_user_sessions(db: Session, user_id: str, status: Optional[SessionStatusEnum] = None) -> int:
     """Count sessions for a user."""
-    query = db.query(SessionModel).filter(SessionModel.user_id == user_id)
+    stmt = select(func.count()).select_from(SessionModel).where(SessionModel.user_id == user_id)
     if status:
-        query = query.filter(SessionModel.status == status)
-    return query.count()
+        stmt = stmt.where(SessionModel.status == status)
+    return db.scalar(stmt)
 
 
 # ============================================================================
 # MESSAGE OPERATIONS (for Session Chat)
 # ============================================================================
 
+def _message_to_dict(message: SessionMessage) -> Dict[str, Any]:
+    """Convert a SessionMessage row to the message dict shape used by the API."""
+    result = {
+        "role": message.role,
+        "content": message.content,
+        "timestamp": message.created_at.isoformat(),
+        "metadata": message.message_metadata or {}
+    }
+    if message.updated_at is not None:
+        result["updated_at"] = message.updated_at.isoformat()
+    return result
+
+
+def _get_message_at(db: Session, session_id: int, message_index: int) -> Optional[SessionMessage]:
+    """Get the message at a 0-based position in a session's history."""
+    if message_index < 0:
+        return None
+    return db.query(SessionMessage).filter(
+        SessionMessage.session_id == session_id
+    ).order_by(SessionMessage.idx).offset(message_index).limit(1).first()
+
+
 def add_message_to_session(
     db: Session,
     session_id: int,
     role: str,
     content: str,
-    metadata: Optional[Dict[str, Any]] = None
-) -> SessionModel:
+    metadata: Optional[Dict[str, Any]] = None,
+    timestamp: Optional[datetime] = None
+) -> Dict[str, Any]:
     """
     Add a message to a session's message history.
     
@@ -139,36 +425,101 @@ def add_message_to_session(
         role: Message role (e.g., 'user', 'assistant', 'system')
         content: Message content
         metadata: Optional metadata (e.g., tokens, model, timestamp)
+        timestamp: Optional creation time (naive UTC); defaults to now
     
     Returns:
-        Updated session with new message
+        The newly added message
     """
-    session = get_session(db, session_id)
-    if not session:
+    # Lock the session row so concurrent appends get distinct positions
+    locked_id = db.query(SessionModel.id).filter(
+        SessionModel.id == session_id
+    ).with_for_update().scalar()
+    if locked_id is None:
         raise ValueError(f"Session {session_id} not found")
     
-    # Initialize messages if None
-    if session.messages is None:
-        session.messages = []
+    # Append in one INSERT ... SELECT: the database computes the next position
+    # and returns the new row, so the history is never read into Python
+    next_idx = select(
+        func.coalesce(func.max(SessionMessage.idx), -1) + 1
+    ).where(SessionMessage.session_id == session_id).scalar_subquery()
+    
+    message = db.scalars(
+        insert(SessionMessage).from_select(
+            [
+                SessionMessage.session_id,
+                SessionMessage.idx,
+                SessionMessage.role,
+                SessionMessage.content,
+                SessionMessage.message_metadata,
+                SessionMessage.created_at
+            ],
+            select(
+                literal(session_id),
+                next_idx,
+                literal(role),
+                literal(content),
+                literal(metadata or {}, JSON),
+                literal(timestamp or datetime.utcnow(), DateTime)
+            )
+        ).returning(SessionMessage)
+    ).one()
+    db.commit()
+    return _message_to_dict(message)
+
+
+def add_messages_to_session(
+    db: Session,
+    session_id: int,
+    messages: List[Dict[str, Any]],
+    timestamp: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Append several messages to a session in one INSERT and one commit.
     
-    # Create message object
-    message = {
-        "role": role,
-        "content": content,
-        "timestamp": datetime.utcnow().isoformat(),
-        "metadata": metadata or {}
-    }
+    Args:
+        session_id: Session ID
+        messages: Message dicts with 'role', 'content' and optional 'metadata',
+            in the order they should be appended
+        timestamp: Optional creation time (naive UTC) shared by the whole batch;
+            defaults to now
+    
+    Returns:
+        The newly added messages
+    """
+    # Lock the session row so concurrent appends get distinct positions
+    locked_id = db.query(SessionModel.id).filter(
+        SessionModel.id == session_id
+    ).with_for_update().scalar()
+    if locked_id is None:
+        raise ValueError(f"Session {session_id} not found")
     
-    # Append message
-    session.messages.append(message)
+    if not messages:
+        return []
+    
+    last_idx = db.scalar(
+        select(func.coalesce(func.max(SessionMessage.idx), -1)).where(
+            SessionMessage.session_id == session_id
+        )
+    )
     
-    # Mark as modified to trigger SQLAlchemy update
-    from sqlalchemy.orm.attributes import flag_modified
-    flag_modified(session, "messages")
+    # One timestamp for the batch instead of a column default call per row
+    created_at = timestamp or datetime.utcnow()
+    rows = [
+        {
+            'session_id': session_id,
+            'idx': last_idx + offset,
+            'role': message['role'],
+            'content': message['content'],
+            'message_metadata': message.get('metadata') or {},
+            'created_at': created_at
+        }
+        for offset, message in enumerate(messages, 1)
+    ]
     
+    # executemany through insertmanyvalues: batched multi-row INSERT ... RETURNING
+    added = db.scalars(insert(SessionMessage).returning(SessionMessage), rows).all()
     db.commit()
-    db.refresh(session)
-    return session
+    return [_message_to_dict(message) for message in added]
 
 
 def get_session_messages(
@@ -188,21 +539,20 @@ def get_session_messages(
     Returns:
         List of messages
     """
-    session = get_session(db, session_id)
-    if not session:
-        return []
-    
-    messages = session.messages or []
+    query = db.query(SessionMessage).filter(SessionMessage.session_id == session_id)
     
     # Filter by role if specified
     if role_filter:
-        messages = [m for m in messages if m.get("role") == role_filter]
+        query = query.filter(SessionMessage.role == role_filter)
     
-    # Limit results (get most recent)
+    # Limit results (get most recent), returned in chronological order
     if limit and limit > 0:
-        messages = messages[-limit:]
+        messages = query.order_by(desc(SessionMessage.idx)).limit(limit).all()
+        messages.reverse()
+    else:
+        messages = query.order_by(SessionMessage.idx).all()
     
-    return messages
+    return [_message_to_dict(m) for m in messages]
 
 
 def get_last_n_messages(
@@ -240,13 +590,11 @@ def clear_session_messages(
     if not session:
         raise ValueError(f"Session {session_id} not found")
     
-    session.messages = []
-    
-    from sqlalchemy.orm.attributes import flag_modified
-    flag_modified(session, "messages")
+    db.query(SessionMessage).filter(
+        SessionMessage.session_id == session_id
+    ).delete(synchronize_session=False)
     
     db.commit()
-    db.refresh(session)
     return session
 
 
@@ -265,8 +613,10 @@ def count_session_messages(
     Returns:
         Number of messages
     """
-    messages = get_session_messages(db, session_id, role_filter=role_filter)
-    return len(messages)
+    stmt = select(func.count()).select_from(SessionMessage).where(SessionMessage.session_id == session_id)
+    if role_filter:
+        stmt = stmt.where(SessionMessage.role == role_filter)
+    return db.scalar(stmt)
 
 
 def delete_message_from_session(
@@ -288,14 +638,10 @@ def delete_message_from_session(
     if not session:
         raise ValueError(f"Session {session_id} not found")
     
-    if session.messages and 0 <= message_index < len(session.messages):
-        session.messages.pop(message_index)
-        
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(session, "messages")
-        
+    message = _get_message_at(db, session_id, message_index)
+    if message:
+        db.delete(message)
         db.commit()
-        db.refresh(session)
     
     return session
 
@@ -323,22 +669,17 @@ def update_message_in_session(
     if not session:
         raise ValueError(f"Session {session_id} not found")
     
-    if session.messages and 0 <= message_index < len(session.messages):
-        message = session.messages[message_index]
-        
+    message = _get_message_at(db, session_id, message_index)
+    if message:
         if content is not None:
-            message["content"] = content
+            message.content = content
         
         if metadata is not None:
-            message["metadata"] = {**message.get("metadata", {}), **metadata}
-        
-        message["updated_at"] = datetime.utcnow().isoformat()
+            message.message_metadata = {**(message.message_metadata or {}), **metadata}
         
-        from sqlalchemy.orm.attributes import flag_modified
-        flag_modified(session, "messages")
+        message.updated_at = _DB_UTC_NOW
         
         db.commit()
-        db.refresh(session)
     
     return session
 
@@ -358,9 +699,15 @@ def create_roadmap(
     graduation_project: Optional[str] = None,
     graduation_project_title: Optional[str] = None,
     graduation_project_requirements: Optional[List[str]] = None,
-    graduation_project_estimated_hours: Optional[int] = None
+    graduation_project_estimated_hours: Optional[int] = None,
+    commit: bool = True
 ) -> Roadmap:
-    """Create a new roadmap for a session."""
+    """
+    Create a new roadmap for a session.
+    
+    With commit=False the roadmap is only flushed (its id is available) and the
+    caller commits, so a roadmap and its goals can be written in one transaction.
+    """
     roadmap = Roadmap(
         session_id=session_id,
         user_request=user_request,
@@ -374,19 +721,20 @@ def create_roadmap(
         graduation_project_estimated_hours=graduation_project_estimated_hours
     )
     db.add(roadmap)
-    db.commit()
-    db.refresh(roadmap)
+    _commit_or_flush(db, commit)
     return roadmap
 
 
 def get_roadmap(db: Session, roadmap_id: int) -> Optional[Roadmap]:
-    """Get a roadmap by ID."""
-    return db.query(Roadmap).filter(Roadmap.id == roadmap_id).first()
+    """Get a roadmap by ID (served from the session's identity map when already loaded)."""
+    return db.get(Roadmap, roadmap_id)
 
 
 def get_roadmap_by_session(db: Session, session_id: int) -> Optional[Roadmap]:
     """Get roadmap for a specific session."""
-    return db.query(Roadmap).filter(Roadmap.session_id == session_id).first()
+    return db.execute(
+        lambda_stmt(lambda: select(Roadmap).where(Roadmap.session_id == session_id).limit(1))
+    ).scalars().first()
 
 
 def update_roadmap(
@@ -395,10 +743,6 @@ def update_roadmap(
     **kwargs
 ) -> Optional[Roadmap]:
     """Update roadmap fields."""
-    roadmap = get_roadmap(db, roadmap_id)
-    if not roadmap:
-        return None
-    
     # Update allowed fields
     allowed_fields = [
         'user_request', 'user_summarized_cv', 'user_expertise_domains',
@@ -407,33 +751,28 @@ def update_roadmap(
         'graduation_project_estimated_hours', 'status'
     ]
     
-    for field, value in kwargs.items():
-        if field in allowed_fields and value is not None:
-            setattr(roadmap, field, value)
-            
+    values = _allowed_values(kwargs, allowed_fields)
     if kwargs.get('status') == RoadmapStatusEnum.COMPLETED:
-        roadmap.completed_at = datetime.utcnow()
+        values['completed_at'] = _DB_UTC_NOW
     
-    db.commit()
-    db.refresh(roadmap)
-    return roadmap
+    return _patch(db, Roadmap, roadmap_id, values)
 
 
+@_invalidates_progress_stats
 def delete_roadmap(db: Session, roadmap_id: int) -> bool:
     """Delete a roadmap (cascades to goals and materials)."""
-    roadmap = get_roadmap(db, roadmap_id)
-    if not roadmap:
-        return False
-    
-    db.delete(roadmap)
+    deleted = db.query(Roadmap).filter(
+        Roadmap.id == roadmap_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
 
 
 # ============================================================================
 # ROADMAP GOAL OPERATIONS
 # ============================================================================
 
+@_invalidates_progress_stats
 def create_goal(
     db: Session,
     roadmap_id: int,
@@ -443,9 +782,10 @@ def create_goal(
     priority: int = 3,
     skill_level: SkillLevelEnum = SkillLevelEnum.BEGINNER,
     estimated_hours: Optional[int] = None,
-    prerequisites: Optional[List[str]] = None
+    prerequisites: Optional[List[str]] = None,
+    commit: bool = True
 ) -> RoadmapGoal:
-    """Create a new roadmap goal."""
+    """Create a new roadmap goal. With commit=False it is only flushed; the caller commits."""
     goal = RoadmapGoal(
         roadmap_id=roadmap_id,
         goal_number=goal_number,
@@ -457,14 +797,56 @@ def create_goal(
         prerequisites=prerequisites
     )
     db.add(goal)
-    db.commit()
-    db.refresh(goal)
+    _commit_or_flush(db, commit)
     return goal
 
 
+@_invalidates_progress_stats
+def bulk_create_goals(
+    db: Session,
+    roadmap_id: int,
+    goals_data: List[Dict[str, Any]],
+    return_defaults: bool = True,
+    commit: bool = True
+) -> List[RoadmapGoal]:
+    """
+    Bulk create roadmap goals from a list of goal dictionaries (one multi-row INSERT).
+    
+    Pass return_defaults=False when the created rows are not needed; the INSERT
+    then skips RETURNING and an empty list is returned. With commit=False the
+    rows are only flushed; the caller commits.
+    """
+    if not goals_data:
+        return []
+    
+    rows = [
+        {
+            'roadmap_id': roadmap_id,
+            'goal_number': goal_data['goal_number'],
+            'title': goal_data['title'],
+            'description': goal_data['description'],
+            'priority': goal_data.get('priority', 3),
+            'skill_level': goal_data.get('skill_level', SkillLevelEnum.BEGINNER),
+            'estimated_hours': goal_data.get('estimated_hours'),
+            'prerequisites': goal_data.get('prerequisites')
+        }
+        for goal_data in goals_data
+    ]
+    
+    stmt = insert(RoadmapGoal).values(rows)
+    if not return_defaults:
+        db.execute(stmt)
+        _commit_or_flush(db, commit)
+        return []
+    
+    goals = db.scalars(stmt.returning(RoadmapGoal)).all()
+    _commit_or_flush(db, commit)
+    return list(goals)
+
+
 def get_goal(db: Session, goal_id: int) -> Optional[RoadmapGoal]:
-    """Get a goal by ID."""
-    return db.query(RoadmapGoal).filter(RoadmapGoal.id == goal_id).first()
+    """Get a goal by ID (served from the session's identity map when already loaded)."""
+    return db.get(RoadmapGoal, goal_id)
 
 
 def get_goals_by_roadmap(
@@ -483,62 +865,76 @@ def get_goals_by_roadmap(
     return query.order_by(RoadmapGoal.goal_number).offset(skip).limit(limit).all()
 
 
+def get_goals_by_roadmap_rows(
+    db: Session,
+    roadmap_id: int,
+    completed_only: bool = False,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Row]:
+    """Read-only variant of get_goals_by_roadmap returning plain rows (no ORM instances)."""
+    stmt = select(*_GOAL_LIST_COLUMNS).where(RoadmapGoal.roadmap_id == roadmap_id)
+    
+    if completed_only:
+        stmt = stmt.where(RoadmapGoal.is_completed == True)
+    
+    stmt = stmt.order_by(RoadmapGoal.goal_number).offset(skip).limit(limit)
+    return db.execute(stmt).all()
+
+
+@_invalidates_progress_stats
 def update_goal(
     db: Session,
     goal_id: int,
     **kwargs
 ) -> Optional[RoadmapGoal]:
     """Update goal fields."""
-    goal = get_goal(db, goal_id)
-    if not goal:
-        return None
-    
     allowed_fields = [
         'title', 'description', 'priority', 'skill_level', 'estimated_hours',
         'actual_hours_spent', 'prerequisites', 'is_completed', 
         'completion_percentage', 'started_at'
     ]
     
-    for field, value in kwargs.items():
-        if field in allowed_fields and value is not None:
-            setattr(goal, field, value)
-    
-    # Handle completion
-    if kwargs.get('is_completed') == True and not goal.completed_at:
-        goal.completed_at = datetime.utcnow()
-        goal.completion_percentage = 100.0
+    values = _allowed_values(kwargs, allowed_fields)
     
-    # Handle starting
-    if kwargs.get('started_at') and not goal.started_at:
-        goal.started_at = kwargs.get('started_at')
+    # Handle completion (first completion stamps completed_at and forces 100%)
+    if kwargs.get('is_completed') == True:
+        first_completion = RoadmapGoal.completed_at.is_(None)
+        values['completed_at'] = func.coalesce(RoadmapGoal.completed_at, _DB_UTC_NOW)
+        values['completion_percentage'] = case(
+            (first_completion, 100.0),
+            else_=values.get('completion_percentage', RoadmapGoal.completion_percentage)
+        )
     
-    db.commit()
-    db.refresh(goal)
-    return goal
+    return _patch(db, RoadmapGoal, goal_id, values)
 
 
 def mark_goal_started(db: Session, goal_id: int) -> Optional[RoadmapGoal]:
     """Mark a goal as started."""
-    goal = get_goal(db, goal_id)
-    if not goal or goal.started_at:
-        return goal
-    
-    goal.started_at = datetime.utcnow()
-    db.commit()
-    db.refresh(goal)
-    return goal
-
-
-def mark_goal_completed(db: Session, goal_id: int) -> Optional[RoadmapGoal]:
-    """Mark a goal as completed."""
-    return update_goal(
+    goal = _patch(
         db,
+        RoadmapGoal,
         goal_id,
-        is_completed=True,
-        completion_percentage=100.0
+        {'started_at': _DB_UTC_NOW},
+        RoadmapGoal.started_at.is_(None)
     )
+    if goal is None:
+        # Either missing or already started
+        return get_goal(db, goal_id)
+    return goal
 
 
+@_invalidates_progress_stats
+def mark_goal_completed(db: Session, goal_id: int, commit: bool = True) -> Optional[RoadmapGoal]:
+    """Mark a goal as completed. With commit=False the update joins the caller's transaction."""
+    return _patch(db, RoadmapGoal, goal_id, {
+        'is_completed': True,
+        'completion_percentage': 100.0,
+        'completed_at': func.coalesce(RoadmapGoal.completed_at, _DB_UTC_NOW)
+    }, commit=commit)
+
+
+@_invalidates_progress_stats
 def update_goal_progress(
     db: Session,
     goal_id: int,
@@ -552,19 +948,20 @@ def update_goal_progress(
     
     if completion_percentage >= 100.0:
         updates['is_completed'] = True
+        updates['completion_percentage'] = 100.0
+        updates['completed_at'] = func.coalesce(RoadmapGoal.completed_at, _DB_UTC_NOW)
     
-    return update_goal(db, goal_id, **updates)
+    return _patch(db, RoadmapGoal, goal_id, updates)
 
 
+@_invalidates_progress_stats
 def delete_goal(db: Session, goal_id: int) -> bool:
     """Delete a goal (cascades to learning materials)."""
-    goal = get_goal(db, goal_id)
-    if not goal:
-        return False
-    
-    db.delete(goal)
+    deleted = db.query(RoadmapGoal).filter(
+        RoadmapGoal.id == goal_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
 
 
 def count_goals_by_roadmap(
@@ -573,16 +970,32 @@ def count_goals_by_roadmap(
     completed_only: bool = False
 ) -> int:
     """Count goals in a roadmap."""
-    query = db.query(RoadmapGoal).filter(RoadmapGoal.roadmap_id == roadmap_id)
+    stmt = select(func.count()).select_from(RoadmapGoal).where(RoadmapGoal.roadmap_id == roadmap_id)
     if completed_only:
-        query = query.filter(RoadmapGoal.is_completed == True)
-    return query.count()
+        stmt = stmt.where(RoadmapGoal.is_completed == True)
+    return db.scalar(stmt)
+
+
+def roadmap_all_goals_completed(db: Session, roadmap_id: int) -> bool:
+    """
+    Check whether every goal in a roadmap is completed (NOT EXISTS an incomplete goal).
+    
+    A roadmap without goals counts as completed; pair with count_goals_by_roadmap
+    when that case matters.
+    """
+    incomplete = select(RoadmapGoal.id).where(
+        RoadmapGoal.roadmap_id == roadmap_id,
+        # IS NOT TRUE so a NULL is_completed counts as incomplete
+        RoadmapGoal.is_completed.isnot(True)
+    )
+    return db.scalar(select(~incomplete.exists()))
 
 
 # ============================================================================
 # LEARNING MATERIAL OPERATIONS
 # ============================================================================
 
+@_invalidates_progress_stats
 def create_learning_material(
     db: Session,
     goal_id: int,
@@ -596,9 +1009,10 @@ def create_learning_material(
     end_of_material_project: Optional[str] = None,
     project_requirements: Optional[List[str]] = None,
     relevance_score: Optional[float] = None,
-    quality_score: Optional[float] = None
+    quality_score: Optional[float] = None,
+    commit: bool = True
 ) -> LearningMaterial:
-    """Create a new learning material."""
+    """Create a new learning material. With commit=False it is only flushed; the caller commits."""
     material = LearningMaterial(
         goal_id=goal_id,
         title=title,
@@ -614,14 +1028,60 @@ def create_learning_material(
         quality_score=quality_score
     )
     db.add(material)
-    db.commit()
-    db.refresh(material)
+    _commit_or_flush(db, commit)
     return material
 
 
+@_invalidates_progress_stats
+def bulk_create_learning_materials(
+    db: Session,
+    goal_id: int,
+    materials_data: List[Dict[str, Any]],
+    return_defaults: bool = True,
+    commit: bool = True
+) -> List[LearningMaterial]:
+    """
+    Bulk create learning materials for a goal (one multi-row INSERT).
+    
+    Pass return_defaults=False when the created rows are not needed; the INSERT
+    then skips RETURNING and an empty list is returned. With commit=False the
+    rows are only flushed; the caller commits.
+    """
+    if not materials_data:
+        return []
+    
+    rows = [
+        {
+            'goal_id': goal_id,
+            'title': material_data['title'],
+            'material_type': material_data['material_type'],
+            'content': material_data.get('content'),
+            'source_url': material_data.get('source_url'),
+            'description': material_data.get('description'),
+            'estimated_time_minutes': material_data.get('estimated_time_minutes'),
+            'difficulty_level': material_data.get('difficulty_level'),
+            'end_of_material_project': material_data.get('end_of_material_project'),
+            'project_requirements': material_data.get('project_requirements'),
+            'relevance_score': material_data.get('relevance_score'),
+            'quality_score': material_data.get('quality_score')
+        }
+        for material_data in materials_data
+    ]
+    
+    stmt = insert(LearningMaterial).values(rows)
+    if not return_defaults:
+        db.execute(stmt)
+        _commit_or_flush(db, commit)
+        return []
+    
+    materials = db.scalars(stmt.returning(LearningMaterial)).all()
+    _commit_or_flush(db, commit)
+    return list(materials)
+
+
 def get_learning_material(db: Session, material_id: int) -> Optional[LearningMaterial]:
-    """Get a learning material by ID."""
-    return db.query(LearningMaterial).filter(LearningMaterial.id == material_id).first()
+    """Get a learning material by ID (served from the session's identity map when already loaded)."""
+    return db.get(LearningMaterial, material_id)
 
 
 def get_materials_by_goal(
@@ -630,9 +1090,16 @@ def get_materials_by_goal(
     material_type: Optional[str] = None,
     completed_only: bool = False,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    after: Optional[Tuple[Optional[float], int]] = None
 ) -> List[LearningMaterial]:
-    """Get all learning materials for a goal."""
+    """
+    Get all learning materials for a goal, most relevant first.
+    
+    For deep paging pass `after=(relevance_score, id)` of the last material of the
+    previous page instead of a growing `skip`; the database then seeks straight
+    to the next page rather than reading and discarding every earlier row.
+    """
     query = db.query(LearningMaterial).filter(LearningMaterial.goal_id == goal_id)
     
     if material_type:
@@ -641,7 +1108,39 @@ def get_materials_by_goal(
     if completed_only:
         query = query.filter(LearningMaterial.is_completed == True)
     
-    return query.order_by(desc(LearningMaterial.relevance_score)).offset(skip).limit(limit).all()
+    if after is not None:
+        query = query.filter(_keyset_after(LearningMaterial.relevance_score, LearningMaterial.id, after))
+    
+    return query.order_by(
+        desc(LearningMaterial.relevance_score), desc(LearningMaterial.id)
+    ).offset(skip).limit(limit).all()
+
+
+def get_materials_by_goal_rows(
+    db: Session,
+    goal_id: int,
+    material_type: Optional[str] = None,
+    completed_only: bool = False,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[Tuple[Optional[float], int]] = None
+) -> List[Row]:
+    """Read-only variant of get_materials_by_goal returning plain rows (no content)."""
+    stmt = select(*_MATERIAL_LIST_COLUMNS).where(LearningMaterial.goal_id == goal_id)
+    
+    if material_type:
+        stmt = stmt.where(LearningMaterial.material_type == material_type)
+    
+    if completed_only:
+        stmt = stmt.where(LearningMaterial.is_completed == True)
+    
+    if after is not None:
+        stmt = stmt.where(_keyset_after(LearningMaterial.relevance_score, LearningMaterial.id, after))
+    
+    stmt = stmt.order_by(
+        desc(LearningMaterial.relevance_score), desc(LearningMaterial.id)
+    ).offset(skip).limit(limit)
+    return db.execute(stmt).all()
 
 
 def get_materials_by_roadmap(
@@ -651,8 +1150,12 @@ def get_materials_by_roadmap(
     skip: int = 0,
     limit: int = 100
 ) -> List[LearningMaterial]:
-    """Get all learning materials for a roadmap (across all goals)."""
-    query = db.query(LearningMaterial).join(RoadmapGoal).filter(
+    """Get all learning materials for a roadmap (across all goals), with .goal populated."""
+    # The goal is already joined for the roadmap filter; contains_eager fills
+    # material.goal from those columns instead of lazy-loading it per row
+    query = db.query(LearningMaterial).join(LearningMaterial.goal).options(
+        contains_eager(LearningMaterial.goal)
+    ).filter(
         RoadmapGoal.roadmap_id == roadmap_id
     )
     
@@ -662,16 +1165,32 @@ def get_materials_by_roadmap(
     return query.order_by(desc(LearningMaterial.relevance_score)).offset(skip).limit(limit).all()
 
 
+def get_materials_by_roadmap_rows(
+    db: Session,
+    roadmap_id: int,
+    material_type: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> List[Row]:
+    """Read-only variant of get_materials_by_roadmap returning plain rows (no content)."""
+    stmt = select(*_MATERIAL_LIST_COLUMNS).join(RoadmapGoal).where(
+        RoadmapGoal.roadmap_id == roadmap_id
+    )
+    
+    if material_type:
+        stmt = stmt.where(LearningMaterial.material_type == material_type)
+    
+    stmt = stmt.order_by(desc(LearningMaterial.relevance_score)).offset(skip).limit(limit)
+    return db.execute(stmt).all()
+
+
+@_invalidates_progress_stats
 def update_learning_material(
     db: Session,
     material_id: int,
     **kwargs
 ) -> Optional[LearningMaterial]:
     """Update learning material fields."""
-    material = get_learning_material(db, material_id)
-    if not material:
-        return None
-    
     allowed_fields = [
         'title', 'content', 'source_url', 'description', 'material_type',
         'estimated_time_minutes', 'difficulty_level', 'end_of_material_project',
@@ -679,16 +1198,11 @@ def update_learning_material(
         'is_completed', 'user_rating', 'user_notes'
     ]
     
-    for field, value in kwargs.items():
-        if field in allowed_fields and value is not None:
-            setattr(material, field, value)
-    
-    if kwargs.get('is_completed') == True and not material.completed_at:
-        material.completed_at = datetime.utcnow()
+    values = _allowed_values(kwargs, allowed_fields)
+    if kwargs.get('is_completed') == True:
+        values['completed_at'] = func.coalesce(LearningMaterial.completed_at, _DB_UTC_NOW)
     
-    db.commit()
-    db.refresh(material)
-    return material
+    return _patch(db, LearningMaterial, material_id, values)
 
 
 def mark_material_completed(
@@ -707,15 +1221,14 @@ def mark_material_completed(
     return update_learning_material(db, material_id, **updates)
 
 
+@_invalidates_progress_stats
 def delete_learning_material(db: Session, material_id: int) -> bool:
     """Delete a learning material."""
-    material = get_learning_material(db, material_id)
-    if not material:
-        return False
-    
-    db.delete(material)
+    deleted = db.query(LearningMaterial).filter(
+        LearningMaterial.id == material_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
 
 
 def count_materials_by_goal(
@@ -724,10 +1237,32 @@ def count_materials_by_goal(
     completed_only: bool = False
 ) -> int:
     """Count learning materials for a goal."""
-    query = db.query(LearningMaterial).filter(LearningMaterial.goal_id == goal_id)
+    stmt = select(func.count()).select_from(LearningMaterial).where(LearningMaterial.goal_id == goal_id)
     if completed_only:
-        query = query.filter(LearningMaterial.is_completed == True)
-    return query.count()
+        stmt = stmt.where(LearningMaterial.is_completed == True)
+    return db.scalar(stmt)
+
+
+def get_goal_material_counts(db: Session, goal_id: int) -> Tuple[int, int]:
+    """Return (completed, total) learning materials for a goal in one aggregate query."""
+    completed, total = db.execute(
+        select(
+            func.count().filter(LearningMaterial.is_completed == True),
+            func.count()
+        ).select_from(LearningMaterial).where(LearningMaterial.goal_id == goal_id)
+    ).one()
+    return completed, total
+
+
+def exists_materials_for_roadmap(db: Session, roadmap_id: int) -> bool:
+    """Check whether a roadmap has any learning materials (stops at the first match)."""
+    return db.scalar(
+        select(
+            select(LearningMaterial.id).join(RoadmapGoal).where(
+                RoadmapGoal.roadmap_id == roadmap_id
+            ).exists()
+        )
+    )
 
 
 # ============================================================================
@@ -754,13 +1289,14 @@ def create_user_skill(
     )
     db.add(skill)
     db.commit()
-    db.refresh(skill)
     return skill
 
 
 def get_user_skill(db: Session, skill_id: int) -> Optional[UserSkill]:
     """Get a user skill by ID."""
-    return db.query(UserSkill).filter(UserSkill.id == skill_id).first()
+    return db.execute(
+        lambda_stmt(lambda: select(UserSkill).where(UserSkill.id == skill_id))
+    ).scalar_one_or_none()
 
 
 def get_user_skills(
@@ -769,9 +1305,15 @@ def get_user_skills(
     skill_level: Optional[SkillLevelEnum] = None,
     verified_only: bool = False,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    after: Optional[Tuple[Optional[float], int]] = None
 ) -> List[UserSkill]:
-    """Get all skills for a user."""
+    """
+    Get all skills for a user, most confident first.
+    
+    For deep paging pass `after=(confidence_score, id)` of the last skill of the
+    previous page instead of a growing `skip`.
+    """
     query = db.query(UserSkill).filter(UserSkill.user_id == user_id)
     
     if skill_level:
@@ -780,7 +1322,12 @@ def get_user_skills(
     if verified_only:
         query = query.filter(UserSkill.verified == True)
     
-    return query.order_by(desc(UserSkill.confidence_score)).offset(skip).limit(limit).all()
+    if after is not None:
+        query = query.filter(_keyset_after(UserSkill.confidence_score, UserSkill.id, after))
+    
+    return query.order_by(
+        desc(UserSkill.confidence_score), desc(UserSkill.id)
+    ).offset(skip).limit(limit).all()
 
 
 def get_user_skill_by_name(
@@ -789,12 +1336,12 @@ def get_user_skill_by_name(
     skill_name: str
 ) -> Optional[UserSkill]:
     """Get a specific skill for a user by skill name."""
-    return db.query(UserSkill).filter(
-        and_(
+    return db.execute(
+        lambda_stmt(lambda: select(UserSkill).where(
             UserSkill.user_id == user_id,
             UserSkill.skill_name == skill_name
-        )
-    ).first()
+        ))
+    ).scalar_one_or_none()
 
 
 def update_user_skill(
@@ -805,20 +1352,36 @@ def update_user_skill(
     verified: Optional[bool] = None
 ) -> Optional[UserSkill]:
     """Update a user skill."""
-    skill = get_user_skill(db, skill_id)
-    if not skill:
-        return None
+    values = {
+        k: v for k, v in {
+            'skill_level': skill_level,
+            'confidence_score': confidence_score,
+            'verified': verified
+        }.items() if v is not None
+    }
     
-    if skill_level is not None:
-        skill.skill_level = skill_level
-    if confidence_score is not None:
-        skill.confidence_score = confidence_score
-    if verified is not None:
-        skill.verified = verified
+    return _patch(db, UserSkill, skill_id, values)
+
+
+def _user_skill_upsert(values: Optional[Dict[str, Any]] = None):
+    """
+    INSERT ... ON CONFLICT (user_id, skill_name) DO UPDATE for one row dict.
     
-    db.commit()
-    db.refresh(skill)
-    return skill
+    Leave values out to get a statement for executemany-style parameter lists.
+    """
+    stmt = pg_insert(UserSkill)
+    if values is not None:
+        stmt = stmt.values(values)
+    return stmt.on_conflict_do_update(
+        index_elements=[UserSkill.user_id, UserSkill.skill_name],
+        set_={
+            'skill_level': stmt.excluded.skill_level,
+            'confidence_score': stmt.excluded.confidence_score,
+            'source': stmt.excluded.source,
+            'verified': stmt.excluded.verified,
+            'updated_at': _DB_UTC_NOW
+        }
+    )
 
 
 def upsert_user_skill(
@@ -830,59 +1393,100 @@ def upsert_user_skill(
     source: str = "cv",
     verified: bool = False
 ) -> UserSkill:
-    """Create or update a user skill."""
-    existing_skill = get_user_skill_by_name(db, user_id, skill_name)
-    
-    if existing_skill:
-        existing_skill.skill_level = skill_level
-        existing_skill.confidence_score = confidence_score
-        existing_skill.source = source
-        existing_skill.verified = verified
-        db.commit()
-        db.refresh(existing_skill)
-        return existing_skill
-    else:
-        return create_user_skill(
-            db, user_id, skill_name, skill_level, 
-            confidence_score, source, verified
-        )
+    """Create or update a user skill (single INSERT ... ON CONFLICT DO UPDATE)."""
+    stmt = _user_skill_upsert({
+        'user_id': user_id,
+        'skill_name': skill_name,
+        'skill_level': skill_level,
+        'confidence_score': confidence_score,
+        'source': source,
+        'verified': verified
+    })
+    skill = db.scalars(
+        stmt.returning(UserSkill),
+        execution_options={"populate_existing": True}
+    ).one()
+    db.commit()
+    return skill
 
 
 def delete_user_skill(db: Session, skill_id: int) -> bool:
     """Delete a user skill."""
-    skill = get_user_skill(db, skill_id)
-    if not skill:
-        return False
-    
-    db.delete(skill)
+    deleted = db.query(UserSkill).filter(
+        UserSkill.id == skill_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
+
+
+def _user_skill_rows(user_id: str, skills: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Build upsert rows from skill dictionaries.
+    
+    A skill name repeated within `skills` is collapsed to its last entry, since one
+    statement can't update the same row twice.
+    """
+    rows_by_name = {
+        skill_data['skill_name']: {
+            'user_id': user_id,
+            'skill_name': skill_data['skill_name'],
+            'skill_level': skill_data.get('skill_level', SkillLevelEnum.BEGINNER),
+            'confidence_score': skill_data.get('confidence_score', 0.8),
+            'source': skill_data.get('source', 'cv'),
+            'verified': skill_data.get('verified', False)
+        }
+        for skill_data in skills
+    }
+    return list(rows_by_name.values())
 
 
 def bulk_create_user_skills(
     db: Session,
     user_id: str,
-    skills: List[Dict[str, Any]]
+    skills: List[Dict[str, Any]],
+    return_defaults: bool = True
 ) -> List[UserSkill]:
-    """Bulk create user skills from a list of skill dictionaries."""
-    skill_objects = []
-    for skill_data in skills:
-        skill = UserSkill(
-            user_id=user_id,
-            skill_name=skill_data['skill_name'],
-            skill_level=skill_data.get('skill_level', SkillLevelEnum.BEGINNER),
-            confidence_score=skill_data.get('confidence_score', 0.8),
-            source=skill_data.get('source', 'cv'),
-            verified=skill_data.get('verified', False)
-        )
-        skill_objects.append(skill)
+    """
+    Bulk create user skills from a list of skill dictionaries (one multi-row upsert).
+    
+    Skills the user already has are updated in place (ON CONFLICT DO UPDATE), so
+    re-importing a CV doesn't fail on the (user_id, skill_name) constraint.
+    Rows are passed as an executemany parameter list, which SQLAlchemy batches
+    into multi-row statements of DB_INSERTMANYVALUES_PAGE_SIZE rows; a large
+    CV therefore never hits the server's bind-parameter limit.
+    Pass return_defaults=False when the created rows (ids, timestamps) are not
+    needed; the statement then skips RETURNING and an empty list is returned.
+    """
+    rows = _user_skill_rows(user_id, skills)
+    if not rows:
+        return []
     
-    db.add_all(skill_objects)
+    stmt = _user_skill_upsert()
+    if not return_defaults:
+        db.execute(stmt, rows)
+        db.commit()
+        return []
+    
+    skill_objects = db.scalars(
+        stmt.returning(UserSkill),
+        rows,
+        execution_options={"populate_existing": True}
+    ).all()
     db.commit()
-    for skill in skill_objects:
-        db.refresh(skill)
+    return list(skill_objects)
+
+
+def bulk_upsert_user_skills(
+    db: Session,
+    user_id: str,
+    skills: List[Dict[str, Any]]
+) -> List[UserSkill]:
+    """
+    Create or update many user skills in one multi-row INSERT ... ON CONFLICT DO UPDATE.
     
-    return skill_objects
+    A skill name repeated within `skills` is collapsed to its last entry.
+    """
+    return bulk_create_user_skills(db, user_id, skills)
 
 
 # ============================================================================
@@ -891,52 +1495,123 @@ def bulk_create_user_skills(
 
 def get_session_with_full_roadmap(db: Session, session_id: int) -> Optional[SessionModel]:
     """Get session with all related data (roadmap, goals, materials)."""
-    from sqlalchemy.orm import joinedload
-    
     return db.query(SessionModel).filter(
         SessionModel.id == session_id
-    ).options(
-        joinedload(SessionModel.roadmap)
-        .joinedload(Roadmap.goals)
-        .joinedload(RoadmapGoal.learning_materials)
-    ).first()
+    ).options(*_FULL_TREE_LOADERS).first()
 
 
+def get_sessions_with_full_tree(
+    db: Session,
+    user_id: str,
+    status: Optional[SessionStatusEnum] = None
+) -> List[SessionModel]:
+    """
+    Get all sessions for a user with roadmap, goals and materials preloaded.
+    
+    For callers that walk the whole tree as objects: three queries in total
+    (sessions + roadmaps, goals, materials) however many sessions and goals there are.
+    """
+    query = db.query(SessionModel).filter(SessionModel.user_id == user_id)
+    
+    if status:
+        query = query.filter(SessionModel.status == status)
+    
+    return query.options(*_FULL_TREE_LOADERS).order_by(desc(SessionModel.created_at)).all()
+
+
+@_cached_progress_stats
 def get_user_progress_stats(db: Session, user_id: str) -> Dict[str, Any]:
-    """Get comprehensive progress statistics for a user."""
-    sessions = get_sessions_by_user(db, user_id)
-    
-    stats = {
-        'total_sessions': len(sessions),
-        'active_sessions': len([s for s in sessions if s.status == SessionStatusEnum.ACTIVE]),
-        'completed_sessions': len([s for s in sessions if s.status == SessionStatusEnum.COMPLETED]),
-        'total_goals': 0,
-        'completed_goals': 0,
-        'total_materials': 0,
-        'completed_materials': 0,
-        'total_hours_estimated': 0,
-        'total_hours_spent': 0
+    """Get comprehensive progress statistics for a user (one aggregate query)."""
+    # Sessions and goals: one pass over sessions -> roadmaps -> goals
+    session_goal_totals = select(
+        func.count(distinct(SessionModel.id)).label('total_sessions'),
+        func.count(distinct(SessionModel.id)).filter(
+            SessionModel.status == SessionStatusEnum.ACTIVE
+        ).label('active_sessions'),
+        func.count(distinct(SessionModel.id)).filter(
+            SessionModel.status == SessionStatusEnum.COMPLETED
+        ).label('completed_sessions'),
+        func.count(RoadmapGoal.id).label('total_goals'),
+        func.count(RoadmapGoal.id).filter(RoadmapGoal.is_completed == True).label('completed_goals'),
+        func.coalesce(func.sum(RoadmapGoal.estimated_hours), 0).label('hours_estimated'),
+        func.coalesce(func.sum(RoadmapGoal.actual_hours_spent), 0).label('hours_spent')
+    ).select_from(SessionModel).outerjoin(
+        Roadmap, Roadmap.session_id == SessionModel.id
+    ).outerjoin(
+        RoadmapGoal, RoadmapGoal.roadmap_id == Roadmap.id
+    ).where(SessionModel.user_id == user_id).subquery()
+    
+    # Materials are aggregated separately so goal sums aren't multiplied by the join
+    material_totals = select(
+        func.count(LearningMaterial.id).label('total_materials'),
+        func.count(LearningMaterial.id).filter(
+            LearningMaterial.is_completed == True
+        ).label('completed_materials')
+    ).join(
+        RoadmapGoal, LearningMaterial.goal_id == RoadmapGoal.id
+    ).join(
+        Roadmap, RoadmapGoal.roadmap_id == Roadmap.id
+    ).join(
+        SessionModel, Roadmap.session_id == SessionModel.id
+    ).where(SessionModel.user_id == user_id).subquery()
+    
+    # Both single-row aggregates come back in one round trip
+    totals = db.execute(
+        select(session_goal_totals, material_totals).select_from(
+            session_goal_totals.join(material_totals, true())
+        )
+    ).one()
+    
+    return {
+        'total_sessions': totals.total_sessions,
+        'active_sessions': totals.active_sessions,
+        'completed_sessions': totals.completed_sessions,
+        'total_goals': totals.total_goals,
+        'completed_goals': totals.completed_goals,
+        'total_materials': totals.total_materials,
+        'completed_materials': totals.completed_materials,
+        'total_hours_estimated': int(totals.hours_estimated),
+        'total_hours_spent': int(totals.hours_spent)
     }
+
+
+@_cached_progress_stats
+def get_session_progress_stats(db: Session, session_id: int) -> Dict[str, Any]:
+    """Get goal/material progress statistics for a session's roadmap (aggregated in SQL)."""
+    goal_totals = db.query(
+        func.count(RoadmapGoal.id),
+        func.count(RoadmapGoal.id).filter(RoadmapGoal.is_completed == True),
+        func.coalesce(func.sum(RoadmapGoal.estimated_hours), 0),
+        func.coalesce(func.sum(RoadmapGoal.actual_hours_spent), 0)
+    ).join(
+        Roadmap, RoadmapGoal.roadmap_id == Roadmap.id
+    ).filter(Roadmap.session_id == session_id).one()
+    
+    material_totals = db.query(
+        func.count(LearningMaterial.id),
+        func.count(LearningMaterial.id).filter(LearningMaterial.is_completed == True)
+    ).join(
+        RoadmapGoal, LearningMaterial.goal_id == RoadmapGoal.id
+    ).join(
+        Roadmap, RoadmapGoal.roadmap_id == Roadmap.id
+    ).filter(Roadmap.session_id == session_id).one()
+    
+    total_goals, completed_goals, hours_estimated, hours_spent = goal_totals
+    total_materials, completed_materials = material_totals
+    
+    completion_percentage = 0.0
+    if total_goals > 0:
+        completion_percentage = round((completed_goals / total_goals) * 100, 2)
     
-    for session in sessions:
-        roadmap = get_roadmap_by_session(db, session.id)
-        if roadmap:
-            goals = get_goals_by_roadmap(db, roadmap.id)
-            stats['total_goals'] += len(goals)
-            
-            for goal in goals:
-                if goal.is_completed:
-                    stats['completed_goals'] += 1
-                if goal.estimated_hours:
-                    stats['total_hours_estimated'] += goal.estimated_hours
-                if goal.actual_hours_spent:
-                    stats['total_hours_spent'] += goal.actual_hours_spent
-                
-                materials = get_materials_by_goal(db, goal.id)
-                stats['total_materials'] += len(materials)
-                stats['completed_materials'] += len([m for m in materials if m.is_completed])
-    
-    return stats
+    return {
+        'total_goals': total_goals,
+        'completed_goals': completed_goals,
+        'total_materials': total_materials,
+        'completed_materials': completed_materials,
+        'total_hours_estimated': int(hours_estimated),
+        'total_hours_spent': int(hours_spent),
+        'completion_percentage': completion_percentage
+    }
 
 
 def get_next_incomplete_goal(db: Session, roadmap_id: int) -> Optional[RoadmapGoal]:
@@ -956,27 +1631,38 @@ def search_learning_materials(
     skip: int = 0,
     limit: int = 50
 ) -> List[LearningMaterial]:
-    """Search learning materials by title or description."""
+    """
+    Search learning materials by title or description, best matches first.
+    
+    Matches whole words via full-text search, and substrings (e.g. partial words)
+    via ILIKE; both are served by GIN indexes. Substring-only hits rank last.
+    Each material's .goal is populated from the join.
+    """
     search_pattern = f"%{search_term}%"
     
-    return db.query(LearningMaterial).join(RoadmapGoal).filter(
-        and_(
+    # Cached via lambda_stmt: the Core tree is built once, later calls only rebind values
+    return db.execute(lambda_stmt(
+        lambda: select(LearningMaterial).join(LearningMaterial.goal).options(
+            contains_eager(LearningMaterial.goal)
+        ).where(
             RoadmapGoal.roadmap_id == roadmap_id,
             or_(
+                LearningMaterial.search_tsv.op('@@')(func.plainto_tsquery('english', search_term)),
                 LearningMaterial.title.ilike(search_pattern),
                 LearningMaterial.description.ilike(search_pattern)
             )
-        )
-    ).offset(skip).limit(limit).all()
+        ).order_by(
+            desc(func.ts_rank_cd(
+                LearningMaterial.search_tsv, func.plainto_tsquery('english', search_term)
+            ))
+        ).offset(skip).limit(limit)
+    )).scalars().all()
 
 
 # ============================================================================
 # GRADUATION PROJECT QUESTIONS OPERATIONS
 # ============================================================================
 
-from models.db_models import GraduationProjectQuestion, GraduationProjectSubmission, QuestionDifficultyEnum
-
-
 def create_graduation_project_question(
     db: Session,
     session_id: int,
@@ -1011,7 +1697,6 @@ def create_graduation_project_question(
     )
     db.add(question)
     db.commit()
-    db.refresh(question)
     return question
 
 # QUIZ OPERATIONS
@@ -1038,34 +1723,33 @@ def create_quiz(
         total_questions=len(questions_data) if questions_data else 0
     )
     db.add(quiz)
-    db.commit()
-    db.refresh(quiz)
+    # Flush for quiz.id; quiz and questions commit together below
+    db.flush()
     
-    # Add questions if provided
+    # Add questions if provided, in one batched INSERT
     if questions_data:
-        for i, question_data in enumerate(questions_data):
-            create_quiz_question(
-                db=db,
-                quiz_id=quiz.id,
-                question_text=question_data['question_text'],
-                question_order=i + 1,
-                options=question_data['options'],
-                correct_answer=question_data['correct_answer'],
-                explanation=question_data.get('explanation'),
-                points=question_data.get('points', 1)
-            )
-        
-        # Update total questions count
-        quiz.total_questions = len(questions_data)
-        db.commit()
-        db.refresh(quiz)
+        db.execute(insert(QuizQuestion), [
+            {
+                'quiz_id': quiz.id,
+                'question_text': question_data['question_text'],
+                'question_order': i + 1,
+                'options': question_data['options'],
+                'correct_answer': question_data['correct_answer'],
+                'explanation': question_data.get('explanation'),
+                'points': question_data.get('points', 1)
+            }
+            for i, question_data in enumerate(questions_data)
+        ])
     
+    db.commit()
     return quiz
 
 
 def get_quiz(db: Session, quiz_id: int) -> Optional[Quiz]:
     """Get a quiz by ID."""
-    return db.query(Quiz).filter(Quiz.id == quiz_id).first()
+    return db.execute(
+        lambda_stmt(lambda: select(Quiz).where(Quiz.id == quiz_id))
+    ).scalar_one_or_none()
 
 
 def get_quizzes_by_goal(
@@ -1108,33 +1792,21 @@ def update_quiz(
     **kwargs
 ) -> Optional[Quiz]:
     """Update quiz fields."""
-    quiz = get_quiz(db, quiz_id)
-    if not quiz:
-        return None
-    
     allowed_fields = [
         'title', 'description', 'difficulty_level', 'time_limit_minutes',
         'passing_score_percentage', 'max_attempts', 'is_active'
     ]
     
-    for field, value in kwargs.items():
-        if field in allowed_fields and value is not None:
-            setattr(quiz, field, value)
-    
-    db.commit()
-    db.refresh(quiz)
-    return quiz
+    return _patch(db, Quiz, quiz_id, _allowed_values(kwargs, allowed_fields))
 
 
 def delete_quiz(db: Session, quiz_id: int) -> bool:
     """Delete a quiz (cascades to questions, attempts, and answers)."""
-    quiz = get_quiz(db, quiz_id)
-    if not quiz:
-        return False
-    
-    db.delete(quiz)
+    deleted = db.query(Quiz).filter(
+        Quiz.id == quiz_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
 
 
 def count_quizzes_by_goal(
@@ -1143,10 +1815,18 @@ def count_quizzes_by_goal(
     active_only: bool = True
 ) -> int:
     """Count quizzes for a goal."""
-    query = db.query(Quiz).filter(Quiz.goal_id == goal_id)
+    stmt = select(func.count()).select_from(Quiz).where(Quiz.goal_id == goal_id)
     if active_only:
-        query = query.filter(Quiz.is_active == True)
-    return query.count()
+        stmt = stmt.where(Quiz.is_active == True)
+    return db.scalar(stmt)
+
+
+def exists_quiz_for_goal(db: Session, goal_id: int, active_only: bool = True) -> bool:
+    """Check whether a goal has any quiz (stops at the first match)."""
+    stmt = select(Quiz.id).where(Quiz.goal_id == goal_id)
+    if active_only:
+        stmt = stmt.where(Quiz.is_active == True)
+    return db.scalar(select(stmt.exists()))
 
 
 # ============================================================================
@@ -1175,7 +1855,6 @@ def create_quiz_question(
     )
     db.add(question)
     db.commit()
-    db.refresh(question)
     return question
 
 
@@ -1194,9 +1873,11 @@ def get_graduation_project_question_by_slug(
     question_id: str
 ) -> Optional[GraduationProjectQuestion]:
     """Get a graduation project question by its slug."""
-    return db.query(GraduationProjectQuestion).filter(
-        GraduationProjectQuestion.question_id == question_id
-    ).first()
+    return db.execute(
+        lambda_stmt(lambda: select(GraduationProjectQuestion).where(
+            GraduationProjectQuestion.question_id == question_id
+        ).limit(1))
+    ).scalars().first()
 
 
 def create_graduation_project_submission(
@@ -1215,7 +1896,6 @@ def create_graduation_project_submission(
     )
     db.add(submission)
     db.commit()
-    db.refresh(submission)
     return submission
 
 
@@ -1223,10 +1903,10 @@ def get_submissions_by_session(
     db: Session,
     session_id: int
 ) -> List[GraduationProjectSubmission]:
-    """Get all submissions for a session."""
+    """Get all submissions for a session (each with its question loaded in the same query)."""
     return db.query(GraduationProjectSubmission).filter(
         GraduationProjectSubmission.session_id == session_id
-    ).all()
+    ).options(joinedload(GraduationProjectSubmission.question)).all()
 
 
 def update_submission_evaluation(
@@ -1237,21 +1917,12 @@ def update_submission_evaluation(
     rubric_scores: Optional[Dict[str, float]] = None
 ) -> Optional[GraduationProjectSubmission]:
     """Update a submission with evaluation results."""
-    submission = db.query(GraduationProjectSubmission).filter(
-        GraduationProjectSubmission.id == submission_id
-    ).first()
-    
-    if not submission:
-        return None
-    
-    submission.evaluation_score = evaluation_score
-    submission.evaluation_feedback = evaluation_feedback
-    submission.rubric_scores = rubric_scores
-    submission.evaluated_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(submission)
-    return submission
+    return _patch(db, GraduationProjectSubmission, submission_id, {
+        'evaluation_score': evaluation_score,
+        'evaluation_feedback': evaluation_feedback,
+        'rubric_scores': rubric_scores,
+        'evaluated_at': _DB_UTC_NOW
+    })
 
 
 def delete_graduation_project_questions_by_session(
@@ -1261,14 +1932,16 @@ def delete_graduation_project_questions_by_session(
     """Delete all graduation project questions for a session."""
     count = db.query(GraduationProjectQuestion).filter(
         GraduationProjectQuestion.session_id == session_id
-    ).delete()
+    ).delete(synchronize_session=False)
     db.commit()
     return count
 
 
 def get_quiz_question(db: Session, question_id: int) -> Optional[QuizQuestion]:
     """Get a quiz question by ID."""
-    return db.query(QuizQuestion).filter(QuizQuestion.id == question_id).first()
+    return db.execute(
+        lambda_stmt(lambda: select(QuizQuestion).where(QuizQuestion.id == question_id))
+    ).scalar_one_or_none()
 
 
 def get_questions_by_quiz(
@@ -1289,38 +1962,28 @@ def update_quiz_question(
     **kwargs
 ) -> Optional[QuizQuestion]:
     """Update quiz question fields."""
-    question = get_quiz_question(db, question_id)
-    if not question:
-        return None
-    
     allowed_fields = [
         'question_text', 'question_order', 'options', 'correct_answer',
         'explanation', 'difficulty_level', 'points'
     ]
     
-    for field, value in kwargs.items():
-        if field in allowed_fields and value is not None:
-            setattr(question, field, value)
-    
-    db.commit()
-    db.refresh(question)
-    return question
+    return _patch(db, QuizQuestion, question_id, _allowed_values(kwargs, allowed_fields))
 
 
 def delete_quiz_question(db: Session, question_id: int) -> bool:
     """Delete a quiz question (cascades to answers)."""
-    question = get_quiz_question(db, question_id)
-    if not question:
-        return False
-    
-    db.delete(question)
+    deleted = db.query(QuizQuestion).filter(
+        QuizQuestion.id == question_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
 
 
 def count_questions_by_quiz(db: Session, quiz_id: int) -> int:
     """Count questions in a quiz."""
-    return db.query(QuizQuestion).filter(QuizQuestion.quiz_id == quiz_id).count()
+    return db.scalar(
+        select(func.count()).select_from(QuizQuestion).where(QuizQuestion.quiz_id == quiz_id)
+    )
 
 
 # ============================================================================
@@ -1333,25 +1996,32 @@ def create_quiz_attempt(
     user_id: str
 ) -> QuizAttempt:
     """Start a new quiz attempt."""
-    # Get the next attempt number for this user and quiz
-    last_attempt = db.query(QuizAttempt).filter(
-        and_(
-            QuizAttempt.quiz_id == quiz_id,
-            QuizAttempt.user_id == user_id
-        )
-    ).order_by(desc(QuizAttempt.attempt_number)).first()
-    
-    attempt_number = (last_attempt.attempt_number + 1) if last_attempt else 1
-    
-    # Get quiz details
-    quiz = get_quiz(db, quiz_id)
+    # One preflight SELECT: quiz limits plus this user's last attempt number.
+    # The quiz row is locked so concurrent starts can't reuse an attempt number
+    # or slip past max_attempts.
+    last_attempt_number = select(
+        func.coalesce(func.max(QuizAttempt.attempt_number), 0)
+    ).where(
+        QuizAttempt.quiz_id == Quiz.id,
+        QuizAttempt.user_id == user_id
+    ).scalar_subquery()
+    
+    quiz = db.execute(
+        select(
+            Quiz.total_questions,
+            Quiz.max_attempts,
+            last_attempt_number.label("last_attempt_number")
+        ).where(Quiz.id == quiz_id).with_for_update(of=Quiz)
+    ).one_or_none()
     if not quiz:
         raise ValueError(f"Quiz {quiz_id} not found")
     
     # Check if user has exceeded max attempts
-    if last_attempt and last_attempt.attempt_number >= quiz.max_attempts:
+    if quiz.last_attempt_number >= quiz.max_attempts:
         raise ValueError(f"Maximum attempts ({quiz.max_attempts}) exceeded for this quiz")
     
+    attempt_number = quiz.last_attempt_number + 1
+    
     attempt = QuizAttempt(
         quiz_id=quiz_id,
         user_id=user_id,
@@ -1360,13 +2030,14 @@ def create_quiz_attempt(
     )
     db.add(attempt)
     db.commit()
-    db.refresh(attempt)
     return attempt
 
 
 def get_quiz_attempt(db: Session, attempt_id: int) -> Optional[QuizAttempt]:
     """Get a quiz attempt by ID."""
-    return db.query(QuizAttempt).filter(QuizAttempt.id == attempt_id).first()
+    return db.execute(
+        lambda_stmt(lambda: select(QuizAttempt).where(QuizAttempt.id == attempt_id))
+    ).scalar_one_or_none()
 
 
 def get_attempts_by_quiz(
@@ -1401,28 +2072,48 @@ def get_attempts_by_user(
     return query.order_by(desc(QuizAttempt.started_at)).offset(skip).limit(limit).all()
 
 
+def iter_attempts_by_user(
+    db: Session,
+    user_id: str,
+    quiz_id: Optional[int] = None,
+    batch_size: int = 200
+) -> Iterator[QuizAttempt]:
+    """Stream all quiz attempts for a user, newest first (server-side cursor, `batch_size` rows per fetch)."""
+    stmt = select(QuizAttempt).where(QuizAttempt.user_id == user_id)
+    
+    if quiz_id:
+        stmt = stmt.where(QuizAttempt.quiz_id == quiz_id)
+    
+    stmt = stmt.order_by(desc(QuizAttempt.started_at)).execution_options(yield_per=batch_size)
+    yield from db.scalars(stmt)
+
+
+@_invalidates_progress_stats
 def submit_quiz_attempt(
     db: Session,
     attempt_id: int,
     answers: List[Dict[str, Any]]
 ) -> QuizAttempt:
     """Submit a completed quiz attempt with answers."""
-    attempt = get_quiz_attempt(db, attempt_id)
+    # Attempt, quiz and questions in a single joined SELECT
+    attempt = db.query(QuizAttempt).options(
+        joinedload(QuizAttempt.quiz).joinedload(Quiz.questions)
+    ).filter(QuizAttempt.id == attempt_id).one_or_none()
     if not attempt:
         raise ValueError(f"Quiz attempt {attempt_id} not found")
     
     if attempt.status != "in_progress":
         raise ValueError("Quiz attempt is not in progress")
     
-    # Get quiz questions
-    questions = get_questions_by_quiz(db, attempt.quiz_id)
-    question_map = {q.id: q for q in questions}
+    quiz = attempt.quiz
+    question_map = {q.id: q for q in quiz.questions}
     
     correct_answers = 0
     total_points = 0
     earned_points = 0
+    answer_rows = []
     
-    # Process each answer
+    # Score each answer; the rows are inserted together below
     for answer_data in answers:
         question_id = answer_data['question_id']
         selected_answer = answer_data['selected_answer']
@@ -1435,45 +2126,43 @@ def submit_quiz_attempt(
         is_correct = selected_answer == question.correct_answer
         points_earned = question.points if is_correct else 0
         
-        # Create answer record
-        answer = QuizAnswer(
-            attempt_id=attempt_id,
-            question_id=question_id,
-            selected_answer=selected_answer,
-            is_correct=is_correct,
-            points_earned=points_earned,
-            time_spent_seconds=time_spent_seconds
-        )
-        db.add(answer)
+        answer_rows.append({
+            'attempt_id': attempt_id,
+            'question_id': question_id,
+            'selected_answer': selected_answer,
+            'is_correct': is_correct,
+            'points_earned': points_earned,
+            'time_spent_seconds': time_spent_seconds
+        })
         
         if is_correct:
             correct_answers += 1
         total_points += question.points
         earned_points += points_earned
     
+    # One batched INSERT for all answer records
+    if answer_rows:
+        db.execute(insert(QuizAnswer), answer_rows)
+    
     # Calculate score
     score_percentage = (earned_points / total_points * 100) if total_points > 0 else 0
     
-    # Get quiz passing score
-    quiz = get_quiz(db, attempt.quiz_id)
     passed = score_percentage >= quiz.passing_score_percentage
     
-    # Update attempt
-    attempt.completed_at = datetime.utcnow()
-    attempt.correct_answers = correct_answers
-    attempt.score_percentage = score_percentage
-    attempt.passed = passed
-    attempt.status = "completed"
-    
-    # Calculate time spent
-    if attempt.started_at:
-        time_delta = attempt.completed_at - attempt.started_at
-        attempt.time_spent_minutes = int(time_delta.total_seconds() / 60)
-    
-    if attempt.passed:
-        mark_goal_completed(db, quiz.goal_id)
+    # Update attempt; the database stamps completion and time spent
+    attempt = _patch(db, QuizAttempt, attempt_id, {
+        'completed_at': _DB_UTC_NOW,
+        'time_spent_minutes': _ATTEMPT_ELAPSED_MINUTES,
+        'correct_answers': correct_answers,
+        'score_percentage': score_percentage,
+        'passed': passed,
+        'status': "completed"
+    }, commit=False)
+    
+    # Answers, attempt result and goal completion commit as one transaction
+    if passed:
+        mark_goal_completed(db, quiz.goal_id, commit=False)
     db.commit()
-    db.refresh(attempt)
     return attempt
 
 
@@ -1482,32 +2171,23 @@ def abandon_quiz_attempt(
     attempt_id: int
 ) -> QuizAttempt:
     """Abandon a quiz attempt."""
-    attempt = get_quiz_attempt(db, attempt_id)
+    attempt = _patch(db, QuizAttempt, attempt_id, {
+        'status': "abandoned",
+        'completed_at': _DB_UTC_NOW,
+        'time_spent_minutes': _ATTEMPT_ELAPSED_MINUTES
+    })
     if not attempt:
         raise ValueError(f"Quiz attempt {attempt_id} not found")
-    
-    attempt.status = "abandoned"
-    attempt.completed_at = datetime.utcnow()
-    
-    # Calculate time spent
-    if attempt.started_at:
-        time_delta = attempt.completed_at - attempt.started_at
-        attempt.time_spent_minutes = int(time_delta.total_seconds() / 60)
-    
-    db.commit()
-    db.refresh(attempt)
     return attempt
 
 
 def delete_quiz_attempt(db: Session, attempt_id: int) -> bool:
     """Delete a quiz attempt (cascades to answers)."""
-    attempt = get_quiz_attempt(db, attempt_id)
-    if not attempt:
-        return False
-    
-    db.delete(attempt)
+    deleted = db.query(QuizAttempt).filter(
+        QuizAttempt.id == attempt_id
+    ).delete(synchronize_session=False)
     db.commit()
-    return True
+    return deleted > 0
 
 
 # ============================================================================
@@ -1546,37 +2226,35 @@ def get_quiz_stats(
     db: Session,
     quiz_id: int
 ) -> Dict[str, Any]:
-    """Get comprehensive statistics for a quiz."""
-    quiz = get_quiz(db, quiz_id)
-    if not quiz:
+    """Get comprehensive statistics for a quiz (quiz row and attempt aggregates in one query)."""
+    completed = QuizAttempt.status == "completed"
+    row = db.query(
+        Quiz.total_questions,
+        Quiz.is_active,
+        func.count(QuizAttempt.id),
+        func.count(QuizAttempt.id).filter(completed),
+        func.count(QuizAttempt.id).filter(completed, QuizAttempt.passed == True),
+        func.coalesce(func.avg(QuizAttempt.score_percentage).filter(completed), 0.0),
+        func.coalesce(func.max(QuizAttempt.score_percentage).filter(completed), 0.0)
+    ).outerjoin(
+        QuizAttempt, QuizAttempt.quiz_id == Quiz.id
+    ).filter(Quiz.id == quiz_id).group_by(Quiz.id).one_or_none()
+    
+    if row is None:
         return {}
     
-    attempts = get_attempts_by_quiz(db, quiz_id)
-    
-    if not attempts:
-        return {
-            'quiz_id': quiz_id,
-            'total_attempts': 0,
-            'average_score': 0.0,
-            'pass_rate': 0.0,
-            'best_score': 0.0,
-            'total_questions': quiz.total_questions,
-            'is_active': quiz.is_active
-        }
-    
-    completed_attempts = [a for a in attempts if a.status == "completed"]
-    scores = [a.score_percentage for a in completed_attempts]
-    passed_attempts = [a for a in completed_attempts if a.passed]
+    (total_questions, is_active, total_attempts, completed_attempts,
+     passed_attempts, average_score, best_score) = row
     
     return {
         'quiz_id': quiz_id,
-        'total_attempts': len(attempts),
-        'completed_attempts': len(completed_attempts),
-        'average_score': sum(scores) / len(scores) if scores else 0.0,
-        'pass_rate': (len(passed_attempts) / len(completed_attempts) * 100) if completed_attempts else 0.0,
-        'best_score': max(scores) if scores else 0.0,
-        'total_questions': quiz.total_questions,
-        'is_active': quiz.is_active
+        'total_attempts': total_attempts,
+        'completed_attempts': completed_attempts,
+        'average_score': float(average_score),
+        'pass_rate': (passed_attempts / completed_attempts * 100) if completed_attempts else 0.0,
+        'best_score': float(best_score),
+        'total_questions': total_questions,
+        'is_active': is_active
     }
 
 
@@ -1585,20 +2263,26 @@ def get_user_quiz_progress(
     user_id: str,
     goal_id: Optional[int] = None
 ) -> Dict[str, Any]:
-    """Get quiz progress statistics for a user."""
-    query = db.query(QuizAttempt).filter(QuizAttempt.user_id == user_id)
+    """Get quiz progress statistics for a user (aggregated in SQL)."""
+    completed = QuizAttempt.status == "completed"
+    query = db.query(
+        func.count(QuizAttempt.id),
+        func.count(QuizAttempt.id).filter(completed),
+        func.count(QuizAttempt.id).filter(completed, QuizAttempt.passed == True),
+        func.coalesce(func.avg(QuizAttempt.score_percentage).filter(completed), 0.0),
+        func.coalesce(func.max(QuizAttempt.score_percentage).filter(completed), 0.0)
+    ).filter(QuizAttempt.user_id == user_id)
     
     if goal_id:
         query = query.join(Quiz).filter(Quiz.goal_id == goal_id)
     
-    attempts = query.all()
-    completed_attempts = [a for a in attempts if a.status == "completed"]
+    total, completed_count, passed, average_score, best_score = query.one()
     
     return {
-        'total_attempts': len(attempts),
-        'completed_attempts': len(completed_attempts),
-        'passed_attempts': len([a for a in completed_attempts if a.passed]),
-        'average_score': sum(a.score_percentage for a in completed_attempts) / len(completed_attempts) if completed_attempts else 0.0,
-        'best_score': max(a.score_percentage for a in completed_attempts) if completed_attempts else 0.0
+        'total_attempts': total,
+        'completed_attempts': completed_count,
+        'passed_attempts': passed,
+        'average_score': float(average_score),
+        'best_score': float(best_score)
     }
 
@@ -1,26 +1,68 @@
-from sqlalchemy import create_engine
+from pathlib import Path
+from sqlalchemy import create_engine, text, Engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, NullPool
 from contextlib import contextmanager
 from typing import Generator
-import os
-from config import settings
+from config import get_settings
 
+settings = get_settings()
 DATABASE_URL = settings.ai_database_url
 
-engine = create_engine(
-    DATABASE_URL,
-    poolclass=QueuePool,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600, 
-    echo=os.getenv("SQL_ECHO", "false").lower() == "true"
-)
+# alembic.ini sits at the service root, next to the migrations/ directory
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+# Arbitrary constant identifying the schema-setup advisory lock
+SCHEMA_LOCK_KEY = 724_311_001
+
+def make_engine(url: str = DATABASE_URL, pool: str = "queue") -> Engine:
+    """
+    Create an engine for the AI database.
+    
+    pool="queue" is the shared application pool, sized for bursts of concurrent
+    requests (threadpool handlers plus parallel material generation) and tunable
+    via the DB_POOL_* settings. LIFO reuse keeps the hot connections warm and lets
+    idle extras age out; DB_STATEMENT_TIMEOUT_MS stops a runaway query from holding
+    one of them indefinitely. pool="null" opens and closes a connection per use, for
+    one-off work such as schema setup that shouldn't leave pooled backends behind;
+    it gets no statement timeout, since index builds on a populated database can
+    run far longer than any request query.
+    """
+    connect_args = {}
+    if pool == "null":
+        pool_args = {"poolclass": NullPool}
+    else:
+        pool_args = {
+            "poolclass": QueuePool,
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_timeout": settings.db_pool_timeout,
+            "pool_recycle": settings.db_pool_recycle,
+            "pool_use_lifo": True,
+        }
+        if settings.db_statement_timeout_ms > 0:
+            connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    
+    return create_engine(
+        url,
+        pool_pre_ping=True,
+        connect_args=connect_args,
+        # Room for every distinct statement the CRUD layer compiles (default is 500)
+        query_cache_size=1200,
+        # Bulk inserts go out as multi-row INSERTs of this many rows (SQLAlchemy default is 1000)
+        insertmanyvalues_page_size=settings.db_insertmanyvalues_page_size,
+        echo=settings.sql_echo,
+        **pool_args
+    )
+
+
+engine = make_engine()
 
+# expire_on_commit=False keeps committed objects readable without a
+# follow-up SELECT, so CRUD writers can return them as-is
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=engine
 )
 
@@ -44,12 +86,34 @@ def get_db_context():
     finally:
         db.close()
 
-# Initialize database (create all tables)
+# Initialize database: apply pending Alembic revisions (which upgrade databases
+# created by older versions), then create any tables that don't exist yet. Runs on
+# a throwaway unpooled engine so the DDL connection isn't kept in the application pool.
 def init_db():
+    from alembic import command
+    from alembic.config import Config
     from models.db_models import Base
-    Base.metadata.create_all(bind=engine)
+    
+    alembic_cfg = Config(str(ALEMBIC_INI))
+    ddl_engine = make_engine(pool="null")
+    try:
+        with ddl_engine.begin() as connection:
+            # Serialize concurrent workers starting up against the same database
+            connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": SCHEMA_LOCK_KEY})
+            alembic_cfg.attributes["connection"] = connection
+            command.upgrade(alembic_cfg, "head")
+            Base.metadata.create_all(bind=connection)
+    finally:
+        ddl_engine.dispose()
 
 # Drop all tables (use carefully!)
 def drop_db():
     from models.db_models import Base
-    Base.metadata.drop_all(bind=engine)
\ No newline at end of file
+    ddl_engine = make_engine(pool="null")
+    try:
+        with ddl_engine.begin() as connection:
+            Base.metadata.drop_all(bind=connection)
+            # Forget applied revisions too, so the next init_db starts from scratch
+            connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+    finally:
+        ddl_engine.dispose()
\ No newline at end of file
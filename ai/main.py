@@ -1,16 +1,14 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Depends
+from fastapi.responses import ORJSONResponse
 from sqlalchemy import text
-from db_config.database import init_db, get_db_context, drop_db
+from db_config.database import engine, init_db, get_db_context, drop_db
 from routes import sessions_router
 from routes.ai_actions import router as ai_router
 from routes.graduation_project import router as graduation_project_router
 from utils.auth import verify_api_key
 import logging
 import sys
-import os
-
-# Enable development mode for auto-reloading prompts
-os.environ['DEBUG'] = 'true'
 
 # Configure logging to show INFO level and above
 logging.basicConfig(
@@ -25,10 +23,28 @@ logging.basicConfig(
 logging.getLogger('utils.ai.service').setLevel(logging.INFO)
 logging.getLogger('uvicorn.access').setLevel(logging.WARNING)  # Reduce noise from access logs
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Migrate/create tables once at startup and release pooled connections on shutdown."""
+    try:
+        init_db()
+    except Exception as e:
+        # Let the app start; /health reports the database as not connected
+        logger.error(f"Database initialization failed: {e}")
+    yield
+    engine.dispose()
+
+
 app = FastAPI(
     title="Drama Llama AI Learning Career Platform",
     description="AI-powered learning platform with personalized roadmaps and materials",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson renders response bodies; much faster than stdlib json on the list endpoints
+    default_response_class=ORJSONResponse
 )
 
 # Include routers
@@ -38,7 +54,6 @@ app.include_router(graduation_project_router)
 
 @app.get("/health")
 def health_check():
-    init_db()
     with get_db_context() as db:
         try:
             db.execute(text("SELECT 1"))
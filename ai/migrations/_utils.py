@@ -0,0 +1,38 @@
+"""
+Schema checks shared by the revisions.
+
+Startup runs the revisions before create_all, against databases in any state:
+empty (fresh install), created by an older create_all, or already partly
+upgraded. Revisions therefore skip tables that don't exist yet (create_all
+builds them in their current form) and objects that are already there.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+def has_table(table: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(table)
+
+
+def has_column(table: str, column: str) -> bool:
+    return any(c["name"] == column for c in sa.inspect(op.get_bind()).get_columns(table))
+
+
+def has_index(table: str, name: str) -> bool:
+    return any(i["name"] == name for i in sa.inspect(op.get_bind()).get_indexes(table))
+
+
+def create_index_if_missing(name: str, table: str, columns, **kwargs) -> None:
+    """Create an index on an existing table unless it is already there."""
+    if has_table(table) and not has_index(table, name):
+        op.create_index(name, table, columns, **kwargs)
+
+
+def drop_index_if_present(name: str, table: str) -> None:
+    if has_table(table) and has_index(table, name):
+        op.drop_index(name, table_name=table)
+
+
+def has_unique_constraint(table: str, name: str) -> bool:
+    return any(u["name"] == name for u in sa.inspect(op.get_bind()).get_unique_constraints(table))
@@ -0,0 +1,48 @@
+"""
+Alembic environment for the AI service database.
+
+Revisions bring databases created by earlier versions of the service (via
+create_all) up to the current models. init_db() runs them on startup with its
+own connection; the alembic CLI opens a fresh unpooled engine instead.
+"""
+
+from logging.config import fileConfig
+
+from alembic import context
+
+from models.db_models import Base
+
+config = context.config
+target_metadata = Base.metadata
+
+# Only configure logging for the CLI; inside the app, main.py owns logging
+if config.config_file_name is not None and "connection" not in config.attributes:
+    fileConfig(config.config_file_name)
+
+
+def run_migrations_online():
+    """Run migrations on the connection passed in by init_db(), or a new one."""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    from db_config.database import make_engine
+
+    ddl_engine = make_engine(pool="null")
+    try:
+        with ddl_engine.connect() as connection:
+            context.configure(connection=connection, target_metadata=target_metadata)
+            with context.begin_transaction():
+                context.run_migrations()
+    finally:
+        ddl_engine.dispose()
+
+
+if context.is_offline_mode():
+    # Revisions inspect the live schema to decide what to do, so there is no SQL-only mode
+    raise SystemExit("Offline (--sql) migrations are not supported; run against the database.")
+
+run_migrations_online()
@@ -0,0 +1,97 @@
+"""Move chat history from sessions.messages into session_messages
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+from migrations._utils import has_table, has_column, create_index_if_missing
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("sessions"):
+        # Fresh database: create_all builds the current schema after the revisions run
+        return
+
+    if not has_table("session_messages"):
+        op.create_table(
+            "session_messages",
+            sa.Column("id", sa.Integer(), primary_key=True),
+            sa.Column("session_id", sa.Integer(), sa.ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("idx", sa.Integer(), nullable=False),
+            sa.Column("role", sa.String(50), nullable=False),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("metadata", sa.JSON()),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+        )
+    create_index_if_missing("ix_session_messages_id", "session_messages", ["id"])
+    create_index_if_missing("ix_session_messages_session_idx", "session_messages", ["session_id", "idx"], unique=True)
+    create_index_if_missing("ix_session_messages_session_role", "session_messages", ["session_id", "role"])
+
+    if not has_column("sessions", "messages"):
+        return
+
+    # Messages written by the new code before this revision ran (create_all made the
+    # table empty) came after the JSON history, so move them behind it first. The
+    # two steps go through negative values to stay clear of the unique (session_id, idx).
+    op.execute("""
+        UPDATE session_messages AS sm
+        SET idx = -(sm.idx + json_array_length(s.messages)) - 1
+        FROM sessions AS s
+        WHERE s.id = sm.session_id AND json_typeof(s.messages) = 'array'
+    """)
+    op.execute("UPDATE session_messages SET idx = -idx - 1 WHERE idx < 0")
+
+    # One row per array element, in array order; timestamps were stored as naive UTC ISO strings
+    op.execute("""
+        INSERT INTO session_messages (session_id, idx, role, content, metadata, created_at, updated_at)
+        SELECT
+            s.id,
+            m.ordinality - 1,
+            coalesce(m.value ->> 'role', 'user'),
+            coalesce(m.value ->> 'content', ''),
+            coalesce(m.value -> 'metadata', '{}'::json),
+            coalesce((m.value ->> 'timestamp')::timestamp, s.created_at),
+            (m.value ->> 'updated_at')::timestamp
+        FROM sessions AS s
+        CROSS JOIN LATERAL json_array_elements(s.messages) WITH ORDINALITY AS m(value, ordinality)
+        WHERE json_typeof(s.messages) = 'array'
+    """)
+
+    op.drop_column("sessions", "messages")
+
+
+def downgrade():
+    if not has_table("session_messages"):
+        return
+
+    op.add_column("sessions", sa.Column("messages", sa.JSON()))
+    op.execute("""
+        UPDATE sessions AS s
+        SET messages = (
+            SELECT json_agg(
+                jsonb_build_object(
+                    'role', sm.role,
+                    'content', sm.content,
+                    'timestamp', to_char(sm.created_at, 'YYYY-MM-DD"T"HH24:MI:SS.US'),
+                    'metadata', coalesce(sm.metadata::jsonb, '{}'::jsonb)
+                )
+                || CASE WHEN sm.updated_at IS NULL THEN '{}'::jsonb
+                        ELSE jsonb_build_object('updated_at', to_char(sm.updated_at, 'YYYY-MM-DD"T"HH24:MI:SS.US'))
+                   END
+                ORDER BY sm.idx
+            )
+            FROM session_messages AS sm
+            WHERE sm.session_id = s.id
+        )
+    """)
+    op.drop_table("session_messages")
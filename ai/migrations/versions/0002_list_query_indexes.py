@@ -0,0 +1,32 @@
+"""Composite indexes for session, goal and material list queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from migrations._utils import create_index_if_missing, drop_index_if_present
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_index_if_missing("ix_sessions_user_status_created", "sessions", ["user_id", "status", "created_at"])
+    create_index_if_missing(
+        "ix_goals_roadmap_completed_num", "roadmap_goals", ["roadmap_id", "is_completed", "goal_number"]
+    )
+    create_index_if_missing(
+        "ix_materials_goal_type_relevance", "learning_materials",
+        ["goal_id", "material_type", sa.text("relevance_score DESC")]
+    )
+
+
+def downgrade():
+    drop_index_if_present("ix_materials_goal_type_relevance", "learning_materials")
+    drop_index_if_present("ix_goals_roadmap_completed_num", "roadmap_goals")
+    drop_index_if_present("ix_sessions_user_status_created", "sessions")
@@ -0,0 +1,59 @@
+"""Full-text and trigram search support on learning_materials
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from migrations._utils import has_table, has_column, create_index_if_missing, drop_index_if_present
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# Same expression as LearningMaterial.search_tsv: title weighted A, description B
+SEARCH_TSV_EXPRESSION = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+)
+
+
+def upgrade():
+    # Unconditional: create_all runs after the revisions and needs gin_trgm_ops
+    # for the trigram indexes on a fresh database too
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    if not has_table("learning_materials"):
+        return
+
+    if not has_column("learning_materials", "search_tsv"):
+        op.add_column(
+            "learning_materials",
+            sa.Column("search_tsv", TSVECTOR(), sa.Computed(SEARCH_TSV_EXPRESSION, persisted=True))
+        )
+    create_index_if_missing("ix_materials_search_tsv", "learning_materials", ["search_tsv"], postgresql_using="gin")
+    create_index_if_missing(
+        "ix_materials_title_trgm", "learning_materials", ["title"],
+        postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+    )
+    create_index_if_missing(
+        "ix_materials_description_trgm", "learning_materials", ["description"],
+        postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}
+    )
+
+
+def downgrade():
+    if not has_table("learning_materials"):
+        return
+
+    drop_index_if_present("ix_materials_description_trgm", "learning_materials")
+    drop_index_if_present("ix_materials_title_trgm", "learning_materials")
+    drop_index_if_present("ix_materials_search_tsv", "learning_materials")
+    if has_column("learning_materials", "search_tsv"):
+        op.drop_column("learning_materials", "search_tsv")
+    # pg_trgm is left installed; other objects in the database may use it
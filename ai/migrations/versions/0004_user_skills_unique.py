@@ -0,0 +1,36 @@
+"""One user_skills row per (user_id, skill_name)
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+from migrations._utils import has_table, has_unique_constraint
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if not has_table("user_skills") or has_unique_constraint("user_skills", "uq_user_skills_user_skill"):
+        return
+
+    # Keep the most recently updated row of each duplicate group (highest id on ties)
+    op.execute("""
+        DELETE FROM user_skills AS older
+        USING user_skills AS newer
+        WHERE older.user_id = newer.user_id
+          AND older.skill_name = newer.skill_name
+          AND (older.updated_at, older.id) < (newer.updated_at, newer.id)
+    """)
+    # Conflict target of the ON CONFLICT (user_id, skill_name) upserts in crud
+    op.create_unique_constraint("uq_user_skills_user_skill", "user_skills", ["user_id", "skill_name"])
+
+
+def downgrade():
+    if has_table("user_skills") and has_unique_constraint("user_skills", "uq_user_skills_user_skill"):
+        op.drop_constraint("uq_user_skills_user_skill", "user_skills", type_="unique")
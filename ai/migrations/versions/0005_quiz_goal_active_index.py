@@ -0,0 +1,21 @@
+"""Index quizzes by (goal_id, is_active)
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+"""
+
+from migrations._utils import create_index_if_missing, drop_index_if_present
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_index_if_missing("ix_quizzes_goal_active", "quizzes", ["goal_id", "is_active"])
+
+
+def downgrade():
+    drop_index_if_present("ix_quizzes_goal_active", "quizzes")
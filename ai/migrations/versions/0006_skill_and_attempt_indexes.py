@@ -0,0 +1,32 @@
+"""Composite indexes for user skill and quiz attempt list queries
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from migrations._utils import create_index_if_missing, drop_index_if_present
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Includes the trailing id DESC the keyset pagination added, matching the model
+    create_index_if_missing(
+        "ix_user_skills_user_verified_confidence", "user_skills",
+        ["user_id", "verified", sa.text("confidence_score DESC"), sa.text("id DESC")]
+    )
+    create_index_if_missing(
+        "ix_quiz_attempts_quiz_user_started", "quiz_attempts",
+        ["quiz_id", "user_id", sa.text("started_at DESC")]
+    )
+
+
+def downgrade():
+    drop_index_if_present("ix_quiz_attempts_quiz_user_started", "quiz_attempts")
+    drop_index_if_present("ix_user_skills_user_verified_confidence", "user_skills")
@@ -0,0 +1,26 @@
+"""Index learning materials by (goal_id, relevance_score DESC, id DESC)
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from migrations._utils import create_index_if_missing, drop_index_if_present
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_index_if_missing(
+        "ix_materials_goal_relevance", "learning_materials",
+        ["goal_id", sa.text("relevance_score DESC"), sa.text("id DESC")]
+    )
+
+
+def downgrade():
+    drop_index_if_present("ix_materials_goal_relevance", "learning_materials")
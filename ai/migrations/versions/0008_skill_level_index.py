@@ -0,0 +1,26 @@
+"""Index user skills by (user_id, skill_level, confidence_score DESC, id DESC)
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+"""
+
+import sqlalchemy as sa
+
+from migrations._utils import create_index_if_missing, drop_index_if_present
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    create_index_if_missing(
+        "ix_user_skills_user_level_confidence", "user_skills",
+        ["user_id", "skill_level", sa.text("confidence_score DESC"), sa.text("id DESC")]
+    )
+
+
+def downgrade():
+    drop_index_if_present("ix_user_skills_user_level_confidence", "user_skills")
@@ -1,6 +1,20 @@
+import re
+from functools import lru_cache
 from utils import PromptLoader
 from pydantic import BaseModel
-from typing import Union, Type, Dict, Any
+from typing import Union, Type, Dict, Any, FrozenSet
+
+# Shared loader; parsed prompts are cached inside PromptLoader
+_LOADER = PromptLoader()
+
+
+@lru_cache(maxsize=128)
+def _placeholder_pattern(keys: FrozenSet[str]) -> "re.Pattern[str]":
+    """Compile one pattern matching {{key}} / {{ key }} for any of the given keys."""
+    # Longest first so a key is never shadowed by one of its prefixes
+    alternation = "|".join(map(re.escape, sorted(keys, key=len, reverse=True)))
+    return re.compile(r"\{\{\s*(" + alternation + r")\s*\}\}")
+
 
 class Prompt:
     def __init__(self, name: str, format: Union[BaseModel, Type[BaseModel], Dict[str, Any]]):
@@ -9,12 +23,17 @@ class Prompt:
         
         prompt_data = self._fetch_prompt()
         self.prompt_data = self._fill_variables(prompt_data)
+        
+        # Index the filled messages once; the first message of each role wins
+        self._messages = self.prompt_data.get('messages', [])
+        self._by_role: Dict[str, str] = {}
+        for message in self._messages:
+            self._by_role.setdefault(message.get('role'), message.get('content', ''))
     
 
     def _fetch_prompt(self):
-        # Use PromptLoader to get the prompt content
-        loader = PromptLoader()
-        return loader.get_prompt(self.name)
+        # Use the shared PromptLoader; it returns a fresh copy of the cached prompt
+        return _LOADER.get_prompt(self.name)
     
     def _fill_variables(self, prompt_data):
         ## Find all variables with {{}} in messages and replace them with values from self.format
@@ -30,15 +49,23 @@ class Prompt:
             # If it's already a dict
             format_dict = self.format
         
-        if 'messages' in prompt_data:
+        if 'messages' in prompt_data and format_dict:
+            # Convert values to strings once to handle lists and other types
+            values = {
+                str(key): value if isinstance(value, str) else str(value)
+                for key, value in format_dict.items()
+            }
+            # One pass per message, matching both {{key}} and {{ key }} patterns
+            substitute = _placeholder_pattern(frozenset(values)).sub
+
+            def replace(match):
+                return values[match.group(1)]
+
             for message in prompt_data['messages']:
-                if 'content' in message:
-                    for key, value in format_dict.items():
-                        # Convert value to string to handle lists and other types
-                        str_value = str(value) if not isinstance(value, str) else value
-                        # Match both {{key}} and {{ key }} patterns
-                        message['content'] = message['content'].replace(f"{{{{{key}}}}}", str_value)
-                        message['content'] = message['content'].replace(f"{{{{ {key} }}}}", str_value)
+                content = message.get('content')
+                if not content:
+                    continue
+                message['content'] = substitute(replace, content)
         return prompt_data
     
     def get_prompt(self):
@@ -51,21 +78,15 @@ class Prompt:
     
     def get_system_prompt(self):
         """Returns just the system prompt content"""
-        for message in self.prompt_data.get('messages', []):
-            if message.get('role') == 'system':
-                return message.get('content', '')
-        return ''
+        return self._by_role.get('system', '')
 
     def get_user_prompt(self):
         """Returns just the user prompt content"""
-        for message in self.prompt_data.get('messages', []):
-            if message.get('role') == 'user':
-                return message.get('content', '')
-        return ''
+        return self._by_role.get('user', '')
 
     def get_messages(self):
         """Returns just the messages array"""
-        return self.prompt_data.get('messages', [])
+        return self._messages
     
     def get_response_format(self):
         """Returns response format specification for structured outputs"""
@@ -1,51 +1,111 @@
 """AI Models package - contains Prompt class and Pydantic schemas."""
 
+import importlib
+from typing import TYPE_CHECKING
+
+# Imported eagerly: the submodule shares the class's name, so a lazy attribute
+# would be shadowed by the module object once anything imports models.Prompt.
+# Prompt itself doesn't pull in db_models or schemas.
 from .Prompt import Prompt
-from .db_models import (
-    Base,
-    SkillLevelEnum,
-    RoadmapStatusEnum,
-    Roadmap,
-    RoadmapGoal,
-    LearningMaterial,
-    UserSkill,
-)
-from .schemas import (
-    # Enums
-    SkillLevel,
-    SessionStatus,
-    MessageRole,
-    
-    # Common Models
-    Skill,
-    Goal,
-    
-    # Chat Models
-    ChatRequest,
-    ChatResponse,
-    
-    # API Response Wrapper
-    APIResponse,
-    HealthCheckResponse,
-    
-    # Session Management
-    SessionCreate,
-    SessionUpdate,
-    SessionResponse,
-    SessionListResponse,
-    SessionProgressStats,
-    MessageCreate,
-    MessageResponse,
-    MessagesListResponse,
-    
-    # AI Tool Response Models
-    ToolCallInstruction,
-    AIToolResponse,
-    RoadmapGoalSchema,
-    RoadmapSkeletonResponse,
-    LearningExample,
-    LearningMaterialResponse,
-)
+
+if TYPE_CHECKING:
+    from .db_models import (
+        Base,
+        SkillLevelEnum,
+        RoadmapStatusEnum,
+        Roadmap,
+        RoadmapGoal,
+        LearningMaterial,
+        UserSkill,
+    )
+    from ._core import (
+        SkillLevel,
+        Skill,
+        ChatRequest,
+        ChatResponse,
+        APIResponse,
+        HealthCheckResponse,
+    )
+    from ._session import (
+        SessionStatus,
+        SessionCreate,
+        SessionUpdate,
+        SessionResponse,
+        SessionListResponse,
+        SessionProgressStats,
+        MessageRole,
+        MessageCreate,
+        MessageResponse,
+        MessagesListResponse,
+    )
+    from ._roadmap import (
+        ToolCallInstruction,
+        AIToolResponse,
+        RoadmapGoalSchema,
+        Goal,
+        RoadmapSkeletonResponse,
+        LearningExample,
+        LearningMaterialResponse,
+    )
+
+# The remaining public names are imported on first access (PEP 562), so importing
+# the package (or one submodule) doesn't build every SQLAlchemy mapper and Pydantic schema.
+_LAZY_SUBMODULES = {
+    ".db_models": (
+        "Base",
+        "SkillLevelEnum",
+        "RoadmapStatusEnum",
+        "Roadmap",
+        "RoadmapGoal",
+        "LearningMaterial",
+        "UserSkill",
+    ),
+    "._core": (
+        "SkillLevel",
+        "Skill",
+        "ChatRequest",
+        "ChatResponse",
+        "APIResponse",
+        "HealthCheckResponse",
+    ),
+    "._session": (
+        "SessionStatus",
+        "SessionCreate",
+        "SessionUpdate",
+        "SessionResponse",
+        "SessionListResponse",
+        "SessionProgressStats",
+        "MessageRole",
+        "MessageCreate",
+        "MessageResponse",
+        "MessagesListResponse",
+    ),
+    "._roadmap": (
+        "ToolCallInstruction",
+        "AIToolResponse",
+        "RoadmapGoalSchema",
+        "Goal",
+        "RoadmapSkeletonResponse",
+        "LearningExample",
+        "LearningMaterialResponse",
+    ),
+}
+_LAZY = {name: module for module, names in _LAZY_SUBMODULES.items() for name in names}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # Prompt class
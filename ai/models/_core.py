@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from typing import Annotated, List, Optional, Any, Literal, get_args, get_origin
+from pydantic import BaseModel, ConfigDict, Field
+from enum import Enum
+from datetime import datetime
+
+
+# ============= ORM Response Base =============
+
+class ORMResponse(BaseModel):
+    """Base for response models built from trusted database rows."""
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """
+        Build the model from an ORM object without running validation.
+        
+        Only for rows read from our own database. Applies what the field
+        validators would (datetimes -> ISO strings, enums -> values) and recurses
+        into List[ORMResponse] fields; attributes the object lacks keep their defaults.
+        """
+        values = {}
+        for name, field in cls.model_fields.items():
+            if not hasattr(obj, name):
+                continue
+            value = getattr(obj, name)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(value, Enum):
+                value = value.value
+            elif get_origin(field.annotation) is list:
+                (item_type,) = get_args(field.annotation)
+                if isinstance(item_type, type) and issubclass(item_type, ORMResponse):
+                    value = [item_type.from_orm_fast(item) for item in value]
+            values[name] = value
+        return cls.model_construct(**values)
+
+
+# ============= Common Models =============
+
+class SkillLevel(str, Enum):
+    """Skill proficiency levels."""
+    BEGINNER = "beginner"
+    INTERMEDIATE = "intermediate"
+    ADVANCED = "advanced"
+    EXPERT = "expert"
+
+
+# Field types use the plain values: a Literal validates as one string-set
+# membership check, where an Enum field goes through enum coercion.
+# The enums stay for callers that want named constants.
+SkillLevelValue = Literal["beginner", "intermediate", "advanced", "expert"]
+
+
+@dataclass(slots=True)
+class Skill:
+    """Skill representation."""
+    name: str
+    level: SkillLevelValue
+    confidence: Annotated[float, Field(ge=0.0, le=1.0)] = 0.8
+
+
+# ============= Chat Models =============
+
+class ChatRequest(BaseModel):
+    """Chat request."""
+    session_id: int
+    userPrompt: str
+
+
+class ChatResponse(BaseModel):
+    """Chat response."""
+    message: str
+    suggestions: List[str] = []
+
+
+# ============= API Response Wrapper =============
+
+class APIResponse(BaseModel):
+    """Standard API response wrapper."""
+    success: bool
+    data: Optional[Any] = None
+    error: Optional[str] = None
+
+
+class HealthCheckResponse(BaseModel):
+    """Health check response."""
+    status: str
+    ollama_connected: bool
+    model: str
@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from typing import Annotated, List, Optional, Dict, Literal
+from pydantic import BaseModel, Field
+from enum import Enum
+
+
+# ============= Graduation Project Questions =============
+
+class QuestionDifficulty(str, Enum):
+    """Question difficulty levels."""
+    INTRODUCTORY = "introductory"
+    INTERMEDIATE = "intermediate"
+    ADVANCED = "advanced"
+
+
+QuestionDifficultyValue = Literal["introductory", "intermediate", "advanced"]
+
+
+class GraduationProjectQuestionSchema(BaseModel):
+    """Schema for a single graduation project question."""
+    question_id: str  # stable kebab-case slug
+    prompt: str
+    rationale: str
+    goals_covered: List[int]
+    materials_covered: List[int]
+    expected_competencies: List[str]
+    difficulty: QuestionDifficultyValue
+    estimated_time_minutes: int = Field(..., ge=10, le=45)
+    evaluation_rubric: List[str]  # 3-5 criteria
+    answer_min_chars: int = 500
+    answer_max_chars: int = 2500
+    requires_material_citations: bool = False
+
+
+class GraduationProjectContext(BaseModel):
+    """Graduation project context for question generation."""
+    title: str
+    description: str
+
+
+class GenerateQuestionsResponse(BaseModel):
+    """Response from graduation project question generation."""
+    graduation_project: GraduationProjectContext
+    questions: List[GraduationProjectQuestionSchema]  # exactly 5
+    graduation_project_db_id: Optional[int] = None
+    question_db_ids: List[Optional[int]] = Field(default_factory=list)
+
+
+@dataclass(slots=True)
+class MaterialCitation:
+    """Citation from a learning material."""
+    material_id: Annotated[int, Field(description="Referenced material ID")]
+    excerpt: Annotated[Optional[str], Field(description="Quoted fragment from material description")] = None
+
+
+@dataclass(slots=True)
+class QuestionAnswer:
+    """User's answer to a graduation project question."""
+    question_id: Annotated[str, Field(description="Question slug (kebab-case)")]
+    text: Annotated[str, Field(description="User's free-form answer")]
+    citations: Annotated[Optional[List[MaterialCitation]], Field(description="Material citations (optional)")] = None
+
+
+class SubmitAnswersRequest(BaseModel):
+    """Request to submit graduation project question answers."""
+    session_id: int
+    answers: List[QuestionAnswer] = Field(..., min_items=5, max_items=5, description="Exactly 5 answers")
+
+
+class SubmissionEvaluation(BaseModel):
+    """Evaluation result for a submission."""
+    submission_id: int = Field(..., description="Submission database ID")
+    question_id: str = Field(..., description="Question slug")
+    score: float = Field(..., ge=0.0, le=1.0, description="Evaluation score (0-1)")
+    feedback: str = Field(..., description="AI-generated feedback")
+    rubric_scores: Optional[Dict[str, float]] = Field(None, description="Per-criterion scores")
+    error: Optional[str] = Field(None, description="Error message if evaluation failed")
+
+
+class SubmitAnswersResponse(BaseModel):
+    """Response after submitting answers."""
+    session_id: int
+    submission_ids: List[int] = Field(..., description="Database IDs of created submissions")
+    message: str = Field(default="Answers submitted successfully")
+    evaluations: Optional[List[SubmissionEvaluation]] = None
@@ -0,0 +1,206 @@
+from dataclasses import dataclass
+from typing import List, Optional
+from pydantic import BaseModel, Field, field_validator
+from datetime import datetime
+
+from ._core import ORMResponse
+
+
+# ============= Quiz Generation =============
+
+@dataclass(slots=True)
+class QuizQuestion:
+    """Quiz question representation."""
+    question: str
+    options: List[str]
+    correctAnswer: str  # A, B, C or D
+    explanation: str
+
+class QuizForGoalResponse(BaseModel):
+    """Response from createQuizForGoal tool."""
+    quiz: List[QuizQuestion]
+
+
+# ============= Quiz Database Models =============
+
+# Valid multiple choice answer letters
+_ANSWER_CHOICES = frozenset("ABCD")
+
+
+def _check_answer_choice(v: str) -> str:
+    if v not in _ANSWER_CHOICES:
+        raise ValueError("must be one of A, B, C or D")
+    return v
+
+
+class QuizQuestionCreate(BaseModel):
+    """Request to create a quiz question."""
+    question_text: str = Field(..., description="The quiz question text")
+    question_order: int = Field(..., description="Order within the quiz")
+    options: List[str] = Field(..., min_items=4, max_items=4, description="Exactly 4 multiple choice options")
+    correct_answer: str = Field(..., description="Correct answer (A, B, C, or D)")
+    explanation: Optional[str] = Field(None, description="Explanation of the correct answer")
+    points: int = Field(1, ge=1, description="Points for correct answer")
+
+    @field_validator('correct_answer')
+    @classmethod
+    def correct_answer_choice(cls, v):
+        return _check_answer_choice(v)
+
+
+class QuizQuestionResponse(ORMResponse):
+    """Quiz question response."""
+    id: int
+    quiz_id: int
+    question_text: str
+    question_order: int
+    options: List[str]
+    correct_answer: str
+    explanation: Optional[str]
+    points: int
+    created_at: str
+    updated_at: str
+    
+    @field_validator('created_at', 'updated_at', mode='before')
+    @classmethod
+    def datetime_to_str(cls, v):
+        if isinstance(v, datetime):
+            return v.isoformat()
+        return v
+
+
+class QuizCreate(BaseModel):
+    """Request to create a quiz."""
+    goal_id: int = Field(..., description="Associated roadmap goal ID")
+    time_limit_minutes: Optional[int] = Field(None, ge=1, description="Time limit in minutes")
+    passing_score_percentage: float = Field(70.0, ge=0.0, le=100.0, description="Passing score percentage")
+    max_attempts: int = Field(3, ge=1, description="Maximum attempts allowed")
+
+class QuizUpdate(BaseModel):
+    """Request to update a quiz."""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    time_limit_minutes: Optional[int] = Field(None, ge=1)
+    passing_score_percentage: Optional[float] = Field(None, ge=0.0, le=100.0)
+    max_attempts: Optional[int] = Field(None, ge=1)
+    is_active: Optional[bool] = None
+
+
+class QuizResponse(ORMResponse):
+    """Quiz response."""
+    id: int
+    goal_id: int
+    title: str
+    description: Optional[str]
+    time_limit_minutes: Optional[int]
+    passing_score_percentage: float
+    max_attempts: int
+    is_active: bool
+    total_questions: int
+    created_at: str
+    updated_at: str
+    questions: List[QuizQuestionResponse] = []
+    
+    @field_validator('created_at', 'updated_at', mode='before')
+    @classmethod
+    def datetime_to_str(cls, v):
+        if isinstance(v, datetime):
+            return v.isoformat()
+        return v
+
+
+class QuizListResponse(BaseModel):
+    """List of quizzes response."""
+    quizzes: List[QuizResponse]
+    total: int
+    skip: int
+    limit: int
+
+
+class QuizAttemptCreate(BaseModel):
+    """Request to start a quiz attempt."""
+    quiz_id: int = Field(..., description="Quiz ID to attempt")
+    user_id: str = Field(..., description="User ID attempting the quiz")
+
+
+class QuizAnswerSubmit(BaseModel):
+    """Request to submit an answer to a quiz question."""
+    question_id: int = Field(..., description="Question ID")
+    selected_answer: str = Field(..., description="Selected answer (A, B, C, or D)")
+    time_spent_seconds: Optional[int] = Field(0, ge=0, description="Time spent on this question")
+
+    @field_validator('selected_answer')
+    @classmethod
+    def selected_answer_choice(cls, v):
+        return _check_answer_choice(v)
+
+
+class QuizAttemptSubmit(BaseModel):
+    """Request to submit a completed quiz attempt."""
+    attempt_id: int = Field(..., description="Attempt ID")
+    answers: List[QuizAnswerSubmit] = Field(..., description="All answers for the quiz")
+
+
+class QuizAnswerResponse(ORMResponse):
+    """Quiz answer response."""
+    id: int
+    attempt_id: int
+    question_id: int
+    selected_answer: Optional[str]
+    is_correct: bool
+    points_earned: int
+    time_spent_seconds: int
+    created_at: str
+    updated_at: str
+    
+    @field_validator('created_at', 'updated_at', mode='before')
+    @classmethod
+    def datetime_to_str(cls, v):
+        if isinstance(v, datetime):
+            return v.isoformat()
+        return v
+
+
+class QuizAttemptResponse(ORMResponse):
+    """Quiz attempt response."""
+    id: int
+    quiz_id: int
+    user_id: str
+    attempt_number: int
+    started_at: str
+    completed_at: Optional[str]
+    total_questions: int
+    correct_answers: int
+    score_percentage: float
+    passed: bool
+    time_spent_minutes: int
+    status: str
+    created_at: str
+    updated_at: str
+    answers: List[QuizAnswerResponse] = []
+    
+    @field_validator('created_at', 'updated_at', 'started_at', 'completed_at', mode='before')
+    @classmethod
+    def datetime_to_str(cls, v):
+        if isinstance(v, datetime):
+            return v.isoformat()
+        return v
+
+
+class QuizAttemptListResponse(BaseModel):
+    """List of quiz attempts response."""
+    attempts: List[QuizAttemptResponse]
+    total: int
+    skip: int
+    limit: int
+
+
+class QuizStatsResponse(BaseModel):
+    """Quiz statistics response."""
+    quiz_id: int
+    total_attempts: int
+    average_score: float
+    pass_rate: float
+    best_score: float
+    total_questions: int
+    is_active: bool
@@ -0,0 +1,71 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Any
+from pydantic import BaseModel, Field, TypeAdapter
+# pydantic needs the typing_extensions TypedDict before Python 3.12
+from typing_extensions import TypedDict
+
+
+# ============= AI Tool Response Models =============
+
+@dataclass(slots=True)
+class ToolCallInstruction:
+    """Tool call instruction from AI."""
+    tool_name: str
+    call_id: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+
+
+class TokenUsage(TypedDict, total=False):
+    """Token counts reported by the LLM API; stays a plain dict at runtime."""
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+class AIToolResponse(BaseModel):
+    """Response from AI with optional tool calls."""
+    content: str
+    has_tool_calls: bool = False
+    tool_calls: List[ToolCallInstruction] = Field(default_factory=list)
+    finish_reason: str = ""
+    usage: TokenUsage = Field(default_factory=dict)
+
+
+class RoadmapGoalSchema(BaseModel):
+    """Schema for a single roadmap goal."""
+    goal_number: int
+    title: str
+    description: str
+    priority: int = Field(..., ge=1, le=5)  # 1 = highest
+    estimated_hours: int
+    prerequisites: List[str] = Field(default_factory=list)
+
+
+# Common-models name for the same shape; an alias keeps it to one core schema
+Goal = RoadmapGoalSchema
+
+
+# Built once with the module; dumps a whole goal list in one pydantic-core call
+RoadmapGoalListAdapter = TypeAdapter(List[RoadmapGoalSchema])
+
+
+class RoadmapSkeletonResponse(BaseModel):
+    """Response from createRoadmapSkeleton or editRoadmapSkeleton tool."""
+    goals: List[RoadmapGoalSchema]
+    graduation_project: str
+    graduation_project_title: str
+
+@dataclass(slots=True)
+class LearningExample:
+    """Example for learning material."""
+    title: str
+    explanation: str
+    code: str = ""
+
+
+class LearningMaterialResponse(BaseModel):
+    """Response from createLearningMaterials tool."""
+    title: str
+    description: str
+    content: str  # Markdown
+    estimated_time_minutes: int
@@ -0,0 +1,103 @@
+from typing import List, Optional, Dict, Any, Literal
+from pydantic import BaseModel, field_validator
+from enum import Enum
+from datetime import datetime
+
+from ._core import ORMResponse
+
+
+# ============= Session Management =============
+
+class SessionStatus(str, Enum):
+    """Session status types."""
+    ACTIVE = "active"
+    COMPLETED = "completed"
+    ARCHIVED = "archived"
+
+
+SessionStatusValue = Literal["active", "completed", "archived"]
+
+
+class SessionCreate(BaseModel):
+    """Request from main backend to create a new session."""
+    user_id: str
+    session_name: Optional[str] = None
+    description: Optional[str] = None
+    status: SessionStatusValue = "active"
+
+
+class SessionUpdate(BaseModel):
+    """Request to update a session."""
+    session_name: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[SessionStatusValue] = None
+
+
+class SessionResponse(ORMResponse):
+    """Session response."""
+    id: int
+    user_id: str
+    session_name: Optional[str]
+    description: Optional[str]
+    status: str
+    created_at: str
+    updated_at: str
+    completed_at: Optional[str]
+    
+    @field_validator('created_at', 'updated_at', 'completed_at', mode='before')
+    @classmethod
+    def datetime_to_str(cls, v):
+        if isinstance(v, datetime):
+            return v.isoformat()
+        return v
+
+
+class SessionListResponse(BaseModel):
+    """List of sessions with metadata."""
+    sessions: List[SessionResponse]
+    total: int
+    skip: int
+    limit: int
+
+
+class SessionProgressStats(BaseModel):
+    """Session progress statistics."""
+    total_goals: int
+    completed_goals: int
+    total_materials: int
+    completed_materials: int
+    total_hours_estimated: int
+    total_hours_spent: int
+    completion_percentage: float
+
+
+class MessageRole(str, Enum):
+    """Message role types."""
+    USER = "user"
+    ASSISTANT = "assistant"
+    SYSTEM = "system"
+
+
+MessageRoleValue = Literal["user", "assistant", "system"]
+
+
+class MessageCreate(BaseModel):
+    """Request to add a message to a session."""
+    role: MessageRoleValue
+    content: str
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class MessageResponse(BaseModel):
+    """Message response."""
+    role: str
+    content: str
+    timestamp: str
+    metadata: Dict[str, Any] = {}
+
+
+class MessagesListResponse(BaseModel):
+    """List of messages response."""
+    session_id: int
+    messages: List[MessageResponse]
+    total: int
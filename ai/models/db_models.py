@@ -1,11 +1,15 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, JSON, Boolean, Enum as SQLEnum
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, JSON, Boolean, Index, UniqueConstraint, Computed, Enum as SQLEnum
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 import enum
 
 Base = declarative_base()
 
+# The trigram indexes on learning_materials need the pg_trgm extension; Alembic
+# revision 0003 creates it, and init_db() applies revisions before create_all.
+
 
 class SkillLevelEnum(str, enum.Enum):
     """Skill proficiency levels."""
@@ -38,6 +42,10 @@ class Session(Base):
     User management is handled by the main backend - we only store user_id references.
     """
     __tablename__ = "sessions"
+    __table_args__ = (
+        # get_sessions_by_user: filter by user (+ status), newest first
+        Index("ix_sessions_user_status_created", "user_id", "status", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String(255), nullable=False, index=True)  # Reference to user in main backend
@@ -45,9 +53,6 @@ class Session(Base):
     # Session details
     session_name = Column(String(500))  # Optional user-defined name
     description = Column(Text)  # Optional description
-
-    # Messages
-    messages = Column(JSON)  # List of messages
     
     # Status
     status = Column(SQLEnum(SessionStatusEnum), default=SessionStatusEnum.ACTIVE)
@@ -59,11 +64,48 @@ class Session(Base):
     
     # Relationships
     roadmap = relationship("Roadmap", back_populates="session", uselist=False, cascade="all, delete-orphan")
+    messages = relationship(
+        "SessionMessage",
+        back_populates="session",
+        order_by="SessionMessage.idx",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
     
     def __repr__(self):
         return f"<Session(id={self.id}, user_id={self.user_id}, status={self.status})>"
 
 
+class SessionMessage(Base):
+    """
+    A single chat message belonging to a session.
+    Stored one row per message so appends and reads touch only the rows involved
+    instead of rewriting the whole history.
+    """
+    __tablename__ = "session_messages"
+    __table_args__ = (
+        Index("ix_session_messages_session_idx", "session_id", "idx", unique=True),
+        Index("ix_session_messages_session_role", "session_id", "role"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    session_id = Column(Integer, ForeignKey("sessions.id", ondelete="CASCADE"), nullable=False)
+    idx = Column(Integer, nullable=False)  # Position within the session, increasing
+    
+    role = Column(String(50), nullable=False)  # user, assistant, system
+    content = Column(Text, nullable=False)
+    message_metadata = Column("metadata", JSON)  # e.g., tokens, model, tool calls
+    
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, nullable=True)  # Set only when the message is edited
+    
+    # Relationships
+    session = relationship("Session", back_populates="messages")
+    
+    def __repr__(self):
+        return f"<SessionMessage(id={self.id}, session_id={self.session_id}, idx={self.idx}, role={self.role})>"
+
+
 class Roadmap(Base):
     """
     Stores roadmap skeleton generated by createRoadmapSkeleton.
@@ -108,6 +150,10 @@ class RoadmapGoal(Base):
     Each goal represents a learning objective in the roadmap.
     """
     __tablename__ = "roadmap_goals"
+    __table_args__ = (
+        # get_goals_by_roadmap: filter by roadmap (+ completion), ordered by goal_number
+        Index("ix_goals_roadmap_completed_num", "roadmap_id", "is_completed", "goal_number"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     roadmap_id = Column(Integer, ForeignKey("roadmaps.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -185,6 +231,35 @@ class LearningMaterial(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     completed_at = Column(DateTime, nullable=True)
     
+    # Full-text search document over title (weight A) + description (weight B),
+    # maintained by Postgres. Deferred so regular material loads don't fetch it.
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+            persisted=True
+        )
+    ))
+    
+    # Indexes (goal_id alone is already indexed for the roadmap join)
+    __table_args__ = (
+        # get_materials_by_goal: filter by goal (+ type), ordered by relevance
+        Index("ix_materials_goal_type_relevance", goal_id, material_type, relevance_score.desc()),
+        # ... and keyset-paged by (relevance_score, id)
+        Index("ix_materials_goal_relevance", goal_id, relevance_score.desc(), id.desc()),
+        # search_learning_materials: full-text match plus substring (ILIKE) match
+        Index("ix_materials_search_tsv", search_tsv, postgresql_using="gin"),
+        Index(
+            "ix_materials_title_trgm", title,
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}
+        ),
+        Index(
+            "ix_materials_description_trgm", description,
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"}
+        ),
+    )
+    
     # Relationships
     goal = relationship("RoadmapGoal", back_populates="learning_materials")
     
@@ -215,6 +290,15 @@ class UserSkill(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # One row per skill per user; conflict target for upsert_user_skill
+        UniqueConstraint("user_id", "skill_name", name="uq_user_skills_user_skill"),
+        # get_user_skills: filter by user (and verified), order by confidence
+        Index("ix_user_skills_user_verified_confidence", user_id, verified, confidence_score.desc(), id.desc()),
+        # get_user_skills(skill_level=...): filter by user and level, same ordering
+        Index("ix_user_skills_user_level_confidence", user_id, skill_level, confidence_score.desc(), id.desc()),
+    )
+    
     def __repr__(self):
         return f"<UserSkill(user_id={self.user_id}, skill={self.skill_name}, level={self.skill_level})>"
 
@@ -320,6 +404,11 @@ class Quiz(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # count_quizzes_by_goal / exists_quiz_for_goal (active filter)
+        Index("ix_quizzes_goal_active", "goal_id", "is_active"),
+    )
+    
     # Relationships
     goal = relationship("RoadmapGoal", back_populates="quizzes")
     questions = relationship("QuizQuestion", back_populates="quiz", cascade="all, delete-orphan")
@@ -395,6 +484,11 @@ class QuizAttempt(Base):
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
+    __table_args__ = (
+        # get_attempts_by_quiz: filter by quiz (and user), newest first
+        Index("ix_quiz_attempts_quiz_user_started", quiz_id, user_id, started_at.desc()),
+    )
+    
     # Relationships
     quiz = relationship("Quiz", back_populates="attempts")
     answers = relationship("QuizAnswer", back_populates="attempt", cascade="all, delete-orphan")
@@ -3,18 +3,26 @@ AI Action routes.
 Handles AI chat and tool execution endpoints.
 """
 
-import json
 import asyncio
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
 from typing import Dict, Any, Optional, AsyncIterator
 from fastapi import APIRouter, Depends, HTTPException, status, Body
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
 from utils.pdf_parse import extract_text_from_pdf
+from db_config.database import SessionLocal
 from db_config import (
     get_db, 
     add_message_to_session, 
     get_session,
+    get_goal,
+    get_roadmap_by_session,
+    get_goals_by_roadmap,
+    get_goals_by_roadmap_rows,
     # Quiz operations
     create_quiz,
     create_quiz_attempt,
@@ -23,6 +31,7 @@ from db_config import (
 from models.schemas import (
     AIToolResponse,
     RoadmapSkeletonResponse,
+    RoadmapGoalListAdapter,
     LearningMaterialResponse,
     APIResponse,
     MessageRole,
@@ -98,10 +107,15 @@ async def chat_with_ai_stream(
         StreamingResponse with SSE events
     """
     async def event_generator() -> AsyncIterator[str]:
-        """Generate SSE events for the chat response."""
+        """
+        Generate SSE events for the chat response.
+        
+        Database and model calls are synchronous, so they run in the threadpool
+        to keep the event loop free for other requests.
+        """
         try:
             # Verify session exists
-            session = get_session(db, session_id)
+            session = await run_in_threadpool(get_session, db, session_id)
             if not session:
                 yield format_sse_event('error', {
                     'message': f'Session {session_id} not found'
@@ -110,7 +124,8 @@ async def chat_with_ai_stream(
             
             # Save user message to session
             try:
-                add_message_to_session(
+                await run_in_threadpool(
+                    add_message_to_session,
                     db=db,
                     session_id=session_id,
                     role=MessageRole.USER.value,
@@ -124,21 +139,23 @@ async def chat_with_ai_stream(
             
             # Get AI response with tool planning
             try:
-                response = ai_service.plan_action(
+                response = await run_in_threadpool(
+                    ai_service.plan_action,
                     session_id=session_id,
                     user_prompt=request.message,
                     db=db
                 )
                 
                 # Save assistant response to session
-                add_message_to_session(
+                await run_in_threadpool(
+                    add_message_to_session,
                     db=db,
                     session_id=session_id,
                     role=MessageRole.ASSISTANT.value,
                     content=response.content,
                     metadata={
                         'has_tool_calls': response.has_tool_calls,
-                        'tool_calls': [tc.dict() for tc in response.tool_calls],
+                        'tool_calls': [asdict(tc) for tc in response.tool_calls],
                         'usage': response.usage
                     }
                 )
@@ -477,8 +494,6 @@ def get_session_roadmap(
     Returns:
         APIResponse with roadmap and goals
     """
-    from db_config.crud import get_roadmap_by_session, get_goals_by_roadmap
-    
     # Verify session exists
     session = get_session(db, session_id)
     if not session:
@@ -496,7 +511,7 @@ def get_session_roadmap(
         )
     
     # Get goals
-    goals = get_goals_by_roadmap(db, roadmap.id)
+    goals = get_goals_by_roadmap_rows(db, roadmap.id)
     
     return APIResponse(
         success=True,
@@ -567,7 +582,8 @@ def format_sse_event(event_name: str, data: Dict[str, Any]) -> str:
     Returns:
         Formatted SSE string
     """
-    json_data = json.dumps(data, ensure_ascii=False)
+    # UTF-8 output like ensure_ascii=False; non-str keys stringified as json.dumps did
+    json_data = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
     return f"event: {event_name}\ndata: {json_data}\n\n"
 
 
@@ -667,7 +683,7 @@ def _execute_tool_call_sync(
             'success': True,
             'operation': 'createRoadmapSkeleton',
             'data': {
-                'goals': [goal.dict() for goal in roadmap_response.goals],
+                'goals': RoadmapGoalListAdapter.dump_python(roadmap_response.goals),
                 'graduation_project': roadmap_response.graduation_project,
                 'graduation_project_title': roadmap_response.graduation_project_title,
                 'total_goals': len(roadmap_response.goals)
@@ -682,9 +698,6 @@ def _execute_tool_call_sync(
         
         # If generate_for_all is True, create materials for all goals in parallel
         if generate_for_all:
-            from db_config.crud import get_roadmap_by_session, get_goals_by_roadmap
-            from concurrent.futures import ThreadPoolExecutor, as_completed
-            
             # Get all goals for this session's roadmap
             roadmap = get_roadmap_by_session(db, session_id)
             if not roadmap:
@@ -702,7 +715,6 @@ def _execute_tool_call_sync(
                 """Helper function to create material for a single goal."""
                 try:
                     # Need to create a new DB session for each thread
-                    from db_config.database import SessionLocal
                     thread_db = SessionLocal()
                     try:
                         material = ai_service.execute_material_creation(
@@ -777,7 +789,6 @@ def _execute_tool_call_sync(
                 raise ValueError("goal_id is required for createLearningMaterials when generate_for_all_goals is False")
             
             # Get the goal to retrieve goal_number
-            from db_config.crud import get_goal
             goal = get_goal(db, goal_id)
             if not goal:
                 raise ValueError(f"Goal with id {goal_id} not found")
@@ -839,7 +850,7 @@ def _execute_tool_call_sync(
 # ============================================================================
 
 @router.post("/sessions/{session_id}/quizzes", response_model=APIResponse)
-async def create_quiz_endpoint(
+def create_quiz_endpoint(
     session_id: int,
     quiz_data: QuizCreate,
     db: Session = Depends(get_db),
@@ -852,7 +863,6 @@ async def create_quiz_endpoint(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Session {session_id} not found"
         )
-    from db_config.crud import get_goal
     goal = get_goal(db, quiz_data.goal_id)
     if not goal:
         raise HTTPException(
@@ -889,7 +899,7 @@ async def create_quiz_endpoint(
         
         return APIResponse(
             success=True,
-            data=QuizResponse.from_orm(quiz),
+            data=QuizResponse.from_orm_fast(quiz),
             message="Quiz created successfully"
         )
     except Exception as e:
@@ -900,7 +910,7 @@ async def create_quiz_endpoint(
 
 
 @router.post("/sessions/{session_id}/quizzes/{quiz_id}/attempts", response_model=APIResponse)
-async def start_quiz_attempt_endpoint(
+def start_quiz_attempt_endpoint(
     session_id: int,
     quiz_id: int,
     attempt_data: QuizAttemptCreate,
@@ -912,7 +922,7 @@ async def start_quiz_attempt_endpoint(
         
         return APIResponse(
             success=True,
-            data=QuizAttemptResponse.from_orm(attempt),
+            data=QuizAttemptResponse.from_orm_fast(attempt),
             message="Quiz attempt started successfully"
         )
     except ValueError as e:
@@ -928,7 +938,7 @@ async def start_quiz_attempt_endpoint(
 
 
 @router.post("/sessions/{session_id}/quiz-attempts/{attempt_id}/submit", response_model=APIResponse)
-async def submit_quiz_attempt_endpoint(
+def submit_quiz_attempt_endpoint(
     session_id: int,
     attempt_id: int,
     submission_data: QuizAttemptSubmit,
@@ -949,7 +959,7 @@ async def submit_quiz_attempt_endpoint(
         
         return APIResponse(
             success=True,
-            data=QuizAttemptResponse.from_orm(attempt),
+            data=QuizAttemptResponse.from_orm_fast(attempt),
             message="Quiz attempt submitted successfully"
         )
     except ValueError as e:
@@ -6,6 +6,7 @@ Handles generation and submission of graduation project assessment questions.
 from typing import List, Dict, Any, Optional
 import json
 import logging
+import re
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from db_config import get_db
@@ -29,9 +30,9 @@ from models.schemas import (
     GraduationProjectContext,
     SubmitAnswersRequest,
     SubmitAnswersResponse,
-    QuestionDifficulty
+    SubmissionEvaluation
 )
-from models.db_models import QuestionDifficultyEnum
+from models.db_models import QuestionDifficultyEnum, GraduationProjectSubmission, LearningMaterial
 from utils.auth import verify_api_key
 from utils.prompt_loader import PromptLoader
 from utils.groq_client import GroqClient
@@ -139,7 +140,6 @@ def generate_questions_from_session_data(
                 goals_section += f"  - **Key Content Summary:** {material['content_summary']}\n"
         
         # Replace the goals section (find the handlebars block and replace it)
-        import re
         goals_pattern = r'{{#each goals}}.*?{{/each}}'
         user_prompt = re.sub(goals_pattern, goals_section, user_prompt, flags=re.DOTALL)
         
@@ -210,7 +210,7 @@ def generate_questions_from_session_data(
                 goals_covered=q_data['goals_covered'],
                 materials_covered=q_data['materials_covered'],
                 expected_competencies=q_data['expected_competencies'],
-                difficulty=QuestionDifficulty(q_data['difficulty']),
+                difficulty=q_data['difficulty'],
                 estimated_time_minutes=q_data['estimated_time_minutes'],
                 evaluation_rubric=q_data['evaluation_rubric'],
                 answer_min_chars=q_data.get('answer_min_chars', 500),
@@ -229,7 +229,7 @@ def generate_questions_from_session_data(
                 goals_covered=question_schema.goals_covered,
                 materials_covered=question_schema.materials_covered,
                 expected_competencies=question_schema.expected_competencies,
-                difficulty=QuestionDifficultyEnum(question_schema.difficulty.value),
+                difficulty=QuestionDifficultyEnum(question_schema.difficulty),
                 estimated_time_minutes=question_schema.estimated_time_minutes,
                 evaluation_rubric=question_schema.evaluation_rubric,
                 answer_min_chars=question_schema.answer_min_chars,
@@ -257,7 +257,7 @@ def generate_questions_from_session_data(
 
 
 @router.post("/{session_id}/generate-questions")
-async def generate_graduation_questions(
+def generate_graduation_questions(
     session_id: int,
     db: Session = Depends(get_db)
 ) -> APIResponse:
@@ -327,7 +327,7 @@ async def generate_graduation_questions(
 
 
 @router.get("/{session_id}/questions")
-async def get_graduation_questions(
+def get_graduation_questions(
     session_id: int,
     db: Session = Depends(get_db)
 ) -> APIResponse:
@@ -384,7 +384,7 @@ async def get_graduation_questions(
     )
 
 
-async def evaluate_submission(submission_id: int, db: Session) -> Dict[str, Any]:
+def evaluate_submission(submission_id: int, db: Session) -> Dict[str, Any]:
     """
     Evaluate a single submission using LLM.
     
@@ -396,7 +396,6 @@ async def evaluate_submission(submission_id: int, db: Session) -> Dict[str, Any]
         Dictionary with evaluation results
     """
     # Get submission with question
-    from models.db_models import GraduationProjectSubmission, LearningMaterial
     submission = db.query(GraduationProjectSubmission).filter(
         GraduationProjectSubmission.id == submission_id
     ).first()
@@ -453,7 +452,6 @@ async def evaluate_submission(submission_id: int, db: Session) -> Dict[str, Any]
         competencies_text = ""
         for comp in question.expected_competencies:
             competencies_text += f"- {comp}\n"
-        import re
         user_prompt = re.sub(
             r'{{#each expected_competencies}}.*?{{/each}}',
             competencies_text,
@@ -569,7 +567,7 @@ async def evaluate_submission(submission_id: int, db: Session) -> Dict[str, Any]
 
 
 @router.post("/{session_id}/submit")
-async def submit_graduation_answers(
+def submit_graduation_answers(
     session_id: int,
     request: SubmitAnswersRequest,
     db: Session = Depends(get_db)
@@ -648,12 +646,11 @@ async def submit_graduation_answers(
         
         # Trigger AI evaluation for all submissions
         logger.info(f"Starting AI evaluation for {len(submission_ids)} submissions...")
-        from models.schemas import SubmissionEvaluation
         evaluation_results = []
         
         for submission_id in submission_ids:
             try:
-                eval_result = await evaluate_submission(submission_id, db)
+                eval_result = evaluate_submission(submission_id, db)
                 evaluation = SubmissionEvaluation(
                     submission_id=eval_result['submission_id'],
                     question_id=eval_result['question_id'],
@@ -692,7 +689,7 @@ async def submit_graduation_answers(
 
 
 @router.get("/{session_id}/submissions")
-async def get_graduation_submissions(
+def get_graduation_submissions(
     session_id: int,
     db: Session = Depends(get_db)
 ) -> APIResponse:
@@ -11,13 +11,13 @@ from db_config import (
     get_db,
     create_session,
     get_session,
-    get_sessions_by_user,
+    get_session_row,
+    get_sessions_by_user_rows,
     update_session,
     delete_session,
     count_user_sessions,
     get_session_with_full_roadmap,
-    get_roadmap_by_session,
-    get_goals_by_roadmap,
+    get_session_progress_stats,
     # Message operations
     add_message_to_session,
     get_session_messages,
@@ -56,8 +56,8 @@ def format_datetime(dt):
 
 
 def session_to_response(session) -> SessionResponse:
-    """Convert session model to response schema."""
-    return SessionResponse(
+    """Convert session model to response schema (values are trusted and pre-formatted, so no validation)."""
+    return SessionResponse.model_construct(
         id=session.id,
         user_id=session.user_id,
         session_name=session.session_name,
@@ -84,7 +84,7 @@ def create_new_session(
     """
     try:
         # Convert string status to enum
-        status_enum = SessionStatusEnum(session_data.status.value)
+        status_enum = SessionStatusEnum(session_data.status)
         
         new_session = create_session(
             db,
@@ -113,7 +113,7 @@ def get_session_by_id(
     
     - **session_id**: Session ID
     """
-    session = get_session(db, session_id)
+    session = get_session_row(db, session_id)
     
     if not session:
         raise HTTPException(
@@ -151,7 +151,7 @@ def get_user_sessions(
                 detail=f"Invalid status: {status_filter}. Must be one of: active, completed, archived"
             )
     
-    sessions = get_sessions_by_user(
+    sessions = get_sessions_by_user_rows(
         db,
         user_id=user_id,
         status=status_enum,
@@ -161,7 +161,7 @@ def get_user_sessions(
     
     total = count_user_sessions(db, user_id, status=status_enum)
     
-    return SessionListResponse(
+    return SessionListResponse.model_construct(
         sessions=[session_to_response(s) for s in sessions],
         total=total,
         skip=skip,
@@ -183,20 +183,13 @@ def update_session_by_id(
     - **description**: New description (optional)
     - **status**: New status (optional)
     """
-    # Check if session exists
-    existing_session = get_session(db, session_id)
-    if not existing_session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session with id {session_id} not found"
-        )
-    
     # Convert status to enum if provided
     status_enum = None
     if session_data.status:
-        status_enum = SessionStatusEnum(session_data.status.value)
+        status_enum = SessionStatusEnum(session_data.status)
     
     try:
+        # UPDATE ... RETURNING: no separate existence check, None means not found
         updated_session = update_session(
             db,
             session_id=session_id,
@@ -204,14 +197,19 @@ def update_session_by_id(
             description=session_data.description,
             status=status_enum
         )
-        
-        return session_to_response(updated_session)
-    
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update session: {str(e)}"
         )
+    
+    if not updated_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session with id {session_id} not found"
+        )
+    
+    return session_to_response(updated_session)
 
 
 @router.delete("/{session_id}", response_model=APIResponse)
@@ -407,40 +405,7 @@ def get_session_progress(
             detail=f"Session with id {session_id} not found"
         )
     
-    roadmap = get_roadmap_by_session(db, session_id)
-    
-    stats = {
-        "total_goals": 0,
-        "completed_goals": 0,
-        "total_materials": 0,
-        "completed_materials": 0,
-        "total_hours_estimated": 0,
-        "total_hours_spent": 0,
-        "completion_percentage": 0.0
-    }
-    
-    if roadmap:
-        goals = get_goals_by_roadmap(db, roadmap.id)
-        stats["total_goals"] = len(goals)
-        
-        for goal in goals:
-            if goal.is_completed:
-                stats["completed_goals"] += 1
-            if goal.estimated_hours:
-                stats["total_hours_estimated"] += goal.estimated_hours
-            if goal.actual_hours_spent:
-                stats["total_hours_spent"] += goal.actual_hours_spent
-            
-            # Count materials
-            materials = goal.learning_materials
-            stats["total_materials"] += len(materials)
-            stats["completed_materials"] += sum(1 for m in materials if m.is_completed)
-        
-        # Calculate overall completion percentage
-        if stats["total_goals"] > 0:
-            stats["completion_percentage"] = round(
-                (stats["completed_goals"] / stats["total_goals"]) * 100, 2
-            )
+    stats = get_session_progress_stats(db, session_id)
     
     return SessionProgressStats(**stats)
 
@@ -455,18 +420,16 @@ def complete_session(
     
     - **session_id**: Session ID
     """
-    session = get_session(db, session_id)
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session with id {session_id} not found"
-        )
-    
     updated_session = update_session(
         db,
         session_id=session_id,
         status=SessionStatusEnum.COMPLETED
     )
+    if not updated_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session with id {session_id} not found"
+        )
     
     return session_to_response(updated_session)
 
@@ -481,18 +444,16 @@ def archive_session(
     
     - **session_id**: Session ID
     """
-    session = get_session(db, session_id)
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Session with id {session_id} not found"
-        )
-    
     updated_session = update_session(
         db,
         session_id=session_id,
         status=SessionStatusEnum.ARCHIVED
     )
+    if not updated_session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session with id {session_id} not found"
+        )
     
     return session_to_response(updated_session)
 
@@ -536,17 +497,16 @@ def add_message(
     - **metadata**: Optional metadata (e.g., model, tokens)
     """
     try:
-        updated_session = add_message_to_session(
+        message = add_message_to_session(
             db,
             session_id=session_id,
-            role=message_data.role.value,
+            role=message_data.role,
             content=message_data.content,
             metadata=message_data.metadata
         )
         
-        # Return the last message (the one just added)
-        last_message = updated_session.messages[-1]
-        return MessageResponse(**last_message)
+        # Plain dict: response_model validates and serializes it once
+        return message
     
     except ValueError as e:
         raise HTTPException(
@@ -589,11 +549,12 @@ def get_messages(
         role_filter=role
     )
     
-    return MessagesListResponse(
-        session_id=session_id,
-        messages=[MessageResponse(**msg) for msg in messages],
-        total=len(messages)
-    )
+    # Plain dicts: response_model validates and serializes them once
+    return {
+        "session_id": session_id,
+        "messages": messages,
+        "total": len(messages)
+    }
 
 
 @router.get("/{session_id}/messages/recent", response_model=MessagesListResponse)
@@ -618,11 +579,12 @@ def get_recent_messages(
     
     messages = get_last_n_messages(db, session_id, n=n)
     
-    return MessagesListResponse(
-        session_id=session_id,
-        messages=[MessageResponse(**msg) for msg in messages],
-        total=len(messages)
-    )
+    # Plain dicts: response_model validates and serializes them once
+    return {
+        "session_id": session_id,
+        "messages": messages,
+        "total": len(messages)
+    }
 
 
 @router.delete("/{session_id}/messages", response_model=APIResponse)
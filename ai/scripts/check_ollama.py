@@ -15,7 +15,9 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from ollama import AsyncClient
-from config import settings
+from config import get_settings
+
+settings = get_settings()
 
 
 async def check_connection() -> bool:
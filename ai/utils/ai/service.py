@@ -4,6 +4,7 @@ Handles AI operations including tool planning and execution.
 """
 
 import json
+import logging
 from typing import Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 
@@ -20,18 +21,22 @@ from models.schemas import (
     LearningExample
 )
 from db_config.crud import (
-    get_session_messages,
+    get_last_n_messages,
     get_session,
     get_roadmap_by_session,
     get_goals_by_roadmap,
+    get_goals_by_roadmap_rows,
     get_goal,
-    get_materials_by_roadmap,
+    exists_materials_for_roadmap,
     create_roadmap,
-    create_goal,
-    create_learning_material
+    bulk_create_goals,
+    create_learning_material,
+    create_quiz
 )
 from models.db_models import SkillLevelEnum
 
+logger = logging.getLogger(__name__)
+
 class AIService:
     """
     AI Service for handling AI operations with Groq.
@@ -70,8 +75,9 @@ class AIService:
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
-        # Get session message history
-        message_history = get_session_messages(db, session_id)
+        # Only the last 10 messages go into the prompt; fetch one extra in case the
+        # newest is the current user_prompt, and let the DB do the slicing
+        message_history = get_last_n_messages(db, session_id, n=11)
         formatted_history = Prompt.format_session_history(message_history)
         
         # Exclude the last message if it matches the current user_prompt
@@ -93,8 +99,7 @@ class AIService:
         roadmap = get_roadmap_by_session(db, session_id)
         has_roadmap = roadmap is not None
 
-        learning_materials = get_materials_by_roadmap(db, roadmap.id) if has_roadmap else []
-        has_learning_materials = len(learning_materials) > 0
+        has_learning_materials = has_roadmap and exists_materials_for_roadmap(db, roadmap.id)
         
         # Conditionally provide tools based on roadmap existence
         # This prevents the AI from trying to use unavailable functionality
@@ -110,14 +115,8 @@ class AIService:
         # Build context for the AI
         context_info = f"Session #{session_id}"
         if has_roadmap:
-            goals = get_goals_by_roadmap(db, roadmap.id)
-            context_info += f"\n- Existing roadmap: {roadmap.graduation_project_title}"
-            context_info += f"\n- Total goals: {len(goals)}"
-            context_info += f"\n- Completed goals: {sum(1 for g in goals if g.is_completed)}"
-            context_info += "\n- Available goals for learning:"
-            for goal in goals:
-                status = "✓ Completed" if goal.is_completed else "○ Not started"
-                context_info += f"\n  * Goal ID {goal.id}: {goal.title} [{status}]"
+            goals = get_goals_by_roadmap_rows(db, roadmap.id)
+            context_info += self._format_goal_context(roadmap, goals)
         else:
             context_info += "\n- No roadmap exists yet."
         
@@ -135,8 +134,6 @@ class AIService:
         messages = prompt.get_messages()
         
         # DEBUG: Log what we're sending to the AI
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info("="*80)
         logger.info("SENDING TO AI:")
         logger.info(f"Session ID: {session_id}")
@@ -206,8 +203,9 @@ class AIService:
         if not session:
             raise ValueError(f"Session {session_id} not found")
         
-        # Get session message history
-        message_history = get_session_messages(db, session_id)
+        # Only the last 10 messages go into the prompt; fetch one extra in case the
+        # newest is the current user_prompt, and let the DB do the slicing
+        message_history = get_last_n_messages(db, session_id, n=11)
         formatted_history = Prompt.format_session_history(message_history)
         
         # Exclude the last message if it matches the current user_prompt
@@ -236,14 +234,8 @@ class AIService:
         # Build context for the AI
         context_info = f"Session #{session_id}"
         if has_roadmap:
-            goals = get_goals_by_roadmap(db, roadmap.id)
-            context_info += f"\n- Existing roadmap: {roadmap.graduation_project_title}"
-            context_info += f"\n- Total goals: {len(goals)}"
-            context_info += f"\n- Completed goals: {sum(1 for g in goals if g.is_completed)}"
-            context_info += "\n- Available goals for learning:"
-            for goal in goals:
-                status = "✓ Completed" if goal.is_completed else "○ Not started"
-                context_info += f"\n  * Goal ID {goal.id}: {goal.title} [{status}]"
+            goals = get_goals_by_roadmap_rows(db, roadmap.id)
+            context_info += self._format_goal_context(roadmap, goals)
         else:
             context_info += "\n- No roadmap exists yet. You must create one first."
         
@@ -464,8 +456,9 @@ class AIService:
         
         # Find previous and next goals
         current_goal_number = goal.goal_number
-        previous_goal = next((g for g in goals if g.goal_number == current_goal_number - 1), None)
-        next_goal = next((g for g in goals if g.goal_number == current_goal_number + 1), None)
+        goals_by_number = {g.goal_number: g for g in goals}
+        previous_goal = goals_by_number.get(current_goal_number - 1)
+        next_goal = goals_by_number.get(current_goal_number + 1)
         
         # Load the learning material prompt
         prompt = Prompt('createlearningmaterial', {
@@ -503,6 +496,27 @@ class AIService:
         
         return material_response
     
+    @staticmethod
+    def _format_goal_context(roadmap, goals) -> str:
+        """Build the roadmap/goal section of the planning context in a single pass over goals."""
+        completed = 0
+        goal_lines = []
+        for goal in goals:
+            if goal.is_completed:
+                completed += 1
+                status = "✓ Completed"
+            else:
+                status = "○ Not started"
+            goal_lines.append(f"\n  * Goal ID {goal.id}: {goal.title} [{status}]")
+        
+        return (
+            f"\n- Existing roadmap: {roadmap.graduation_project_title}"
+            f"\n- Total goals: {len(goals)}"
+            f"\n- Completed goals: {completed}"
+            "\n- Available goals for learning:"
+            + "".join(goal_lines)
+        )
+    
     def _save_roadmap_to_db(
         self,
         session_id: int,
@@ -522,10 +536,12 @@ class AIService:
             user_request=tool_arguments.get('userRequest', ''),
             total_estimated_weeks=total_weeks,
             graduation_project=roadmap_response.graduation_project,
-            graduation_project_title=roadmap_response.graduation_project_title
+            graduation_project_title=roadmap_response.graduation_project_title,
+            commit=False
         )
         
-        # Create goals
+        # Create all goals in one INSERT; the roadmap and goals commit together
+        goals_data = []
         for goal_data in roadmap_response.goals:
             # Determine skill level based on priority
             if goal_data.priority <= 2:
@@ -535,17 +551,22 @@ class AIService:
             else:
                 skill_level = SkillLevelEnum.BEGINNER
             
-            create_goal(
-                db=db,
-                roadmap_id=roadmap.id,
-                goal_number=goal_data.goal_number,
-                title=goal_data.title,
-                description=goal_data.description,
-                priority=goal_data.priority,
-                skill_level=skill_level,
-                estimated_hours=goal_data.estimated_hours,
-                prerequisites=goal_data.prerequisites
-            )
+            goals_data.append({
+                'goal_number': goal_data.goal_number,
+                'title': goal_data.title,
+                'description': goal_data.description,
+                'priority': goal_data.priority,
+                'skill_level': skill_level,
+                'estimated_hours': goal_data.estimated_hours,
+                'prerequisites': goal_data.prerequisites
+            })
+        
+        bulk_create_goals(
+            db=db,
+            roadmap_id=roadmap.id,
+            goals_data=goals_data,
+            return_defaults=False
+        )
     
     def _save_material_to_db(
         self,
@@ -584,8 +605,6 @@ class AIService:
         db: Session
     ):
         """Save generated quiz to database."""
-        from db_config.crud import create_quiz
-        
         # Convert quiz questions to the format expected by create_quiz
         questions_data = []
         for question in quiz_response.quiz:
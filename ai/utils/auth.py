@@ -3,7 +3,7 @@ Authentication utilities for API key validation.
 """
 from typing import Optional
 from fastapi import Header, HTTPException, status
-from config import settings
+from config import get_settings
 
 
 def verify_api_key(x_api_key: Optional[str] = Header(None, alias="X-API-Key")) -> str:
@@ -25,7 +25,7 @@ def verify_api_key(x_api_key: Optional[str] = Header(None, alias="X-API-Key")) -
             detail="API key is required. Please provide X-API-Key header."
         )
     
-    if x_api_key != settings.api_key_secret:
+    if x_api_key != get_settings().api_key_secret:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid API key"
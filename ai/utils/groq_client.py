@@ -7,7 +7,7 @@ import os
 import time
 from typing import List, Dict, Any, Optional, Union
 from openai import OpenAI
-from config import settings
+from config import get_settings
 
 
 class AIResponse:
@@ -134,6 +134,7 @@ class GroqClient:
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries on failure
         """
+        settings = get_settings()
         self.api_key = api_key or settings.groq_api_key
         self.model = model or settings.groq_model
         self.temperature = temperature
@@ -1,14 +1,25 @@
 # utils/prompt_loader.py
 
+import copy
 import os
-import yaml
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional
+from config import get_settings
 from utils import YamlParser
 
+
+@lru_cache(maxsize=256)
+def _load_prompt_file(file_path: str, mtime: Optional[float]) -> Dict[str, Any]:
+    """Parse a prompt file; in debug mode keyed on mtime so edited files are re-read."""
+    return YamlParser(file_path=file_path).parse()
+
+
 class PromptLoader:
     """
-    PromptLoader that loads prompts fresh every time (no caching).
-    This ensures prompt changes are always picked up immediately.
+    PromptLoader that caches parsed prompts. Callers get a deep copy they may mutate.
+    
+    With DEBUG=true the cache is keyed on file modification time, so prompt
+    changes are picked up immediately; otherwise each prompt is read once per process.
     """
     
     def __init__(self) -> None:
@@ -17,7 +28,7 @@ class PromptLoader:
     
     def get_prompt(self, name: str) -> Dict[str, Any]:
         """
-        Get a prompt by name. Loads fresh from disk every time.
+        Get a prompt by name, parsing the file on first use (and, in debug mode, after it changes).
         
         Args:
             name: Name of the prompt (without .prompt.yaml extension)
@@ -35,17 +46,17 @@ class PromptLoader:
         prompt_file = f"{name}.prompt.yaml"
         file_path = os.path.join(self.directory, prompt_file)
         
-        # Check if file exists
-        if not os.path.exists(file_path):
+        try:
+            # Only debug mode pays for a stat per call to notice edited prompts
+            mtime = os.stat(file_path).st_mtime if get_settings().debug else None
+            prompt_data = _load_prompt_file(file_path, mtime)
+        except FileNotFoundError:
             raise ValueError(f"Prompt '{name}' not found at {file_path}")
         
-        # Load and parse the YAML file
-        with open(file_path, 'r', encoding='utf-8') as file:
-            prompt_data = YamlParser(file_path=file.name).parse()
-        
-        return prompt_data
+        # Copy so variable substitution never touches the cached original
+        return copy.deepcopy(prompt_data)
     
     @classmethod
     def reset(cls) -> None:
-        """Reset method for compatibility (no-op since we don't cache)."""
-        pass
\ No newline at end of file
+        """Drop all cached prompts."""
+        _load_prompt_file.cache_clear()
\ No newline at end of file